@@ -0,0 +1,164 @@
+"""Headless batch runner: generate user stories for every requirement in a JSONL file.
+
+    python batch_runner.py requirements.jsonl results.jsonl --concurrency 8
+
+Each output line records the input line it came from, so rerunning the same
+command after a crash skips everything that already succeeded. Lines whose
+record has an `error` (an unreadable input line, a failed run, or stories
+that did not all reach Jira) are run again and get a newer record; the last
+record for a line wins.
+"""
+import os
+import json
+import asyncio
+import argparse
+from itertools import islice
+from src.graphs.workflow_graph import build_async_workflow
+from src.graphs.workflow_registry import get_workflow
+from src.utils.telemetry import format_summary
+
+ASYNC_WORKFLOW = "async"
+
+
+def read_prompts(path, prompt_field, completed):
+    """Yield `(line_number, prompt, error)` for every input line not yet in `completed`.
+
+    A line that is not JSON or lacks `prompt_field` comes back with `error` set instead of a prompt.
+    """
+    with open(path, encoding="utf-8") as f:
+        for line_number, line in enumerate(f, start=1):
+            if not line.strip() or line_number in completed:
+                continue
+            try:
+                yield line_number, json.loads(line)[prompt_field], None
+            except (json.JSONDecodeError, KeyError, TypeError) as e:
+                yield line_number, None, f"Unreadable input line: {e!r}"
+
+
+def read_completed(path):
+    """Return the input line numbers that already have a successful record in the output file."""
+    completed = set()
+    if not os.path.exists(path):
+        return completed
+
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # A torn final line from a crash; its input is simply redone
+                continue
+            if isinstance(record, dict) and "line" in record:
+                if record.get("error") is None:
+                    completed.add(record["line"])
+                else:
+                    completed.discard(record["line"])
+    return completed
+
+
+def to_record(line_number, prompt, result):
+    """Convert a workflow result (or the exception it raised) into an output record."""
+    if isinstance(result, Exception):
+        return {"line": line_number, "prompt": prompt, "error": repr(result)}
+
+    user_stories = result.get("user_stories")
+    jira_results = result.get("jira_results") or []
+    failed = sum(jira_result["error"] is not None for jira_result in jira_results)
+    return {
+        "line": line_number,
+        "prompt": prompt,
+        "user_stories": user_stories.model_dump()["stories"] if user_stories else [],
+        "jira_results": jira_results,
+        # Incomplete, so a rerun retries it; the Jira ledger skips stories already created
+        "error": f"Jira issue creation failed for {failed} of {len(jira_results)} stories" if failed else None,
+    }
+
+
+def _open_output(path):
+    """Open the output for appending, starting on a fresh line if the last write was torn."""
+    output = open(path, "a+", encoding="utf-8")
+    if output.tell():
+        output.seek(output.tell() - 1)
+        if output.read(1) != "\n":
+            output.write("\n")
+    return output
+
+
+def _write(output, records):
+    for record in records:
+        output.write(json.dumps(record) + "\n")
+    output.flush()
+    os.fsync(output.fileno())
+
+
+def _chunk_inputs(chunk):
+    return [{"prompt": prompt} for _, prompt, error in chunk if error is None]
+
+
+def _chunk_records(chunk, results):
+    """Pair each chunk entry with its result, recording unreadable lines as errors."""
+    results = iter(results)
+    return [
+        {"line": line_number, "prompt": None, "error": error} if error is not None
+        else to_record(line_number, prompt, next(results))
+        for line_number, prompt, error in chunk
+    ]
+
+
+async def _arun_chunks(workflow, pending, chunk_size, config, output):
+    """Drive every chunk through `abatch` on one event loop, so pooled async clients stay usable."""
+    processed = 0
+    while chunk := list(islice(pending, chunk_size)):
+        inputs = _chunk_inputs(chunk)
+        results = await workflow.abatch(inputs, config, return_exceptions=True) if inputs else []
+        _write(output, _chunk_records(chunk, results))
+        processed += len(chunk)
+        print(f"Processed {processed} requirement(s).")
+    return processed
+
+
+def run_batch(input_path, output_path, concurrency=4, chunk_size=None, prompt_field="prompt", use_async=False):
+    """Run every pending prompt through the compiled workflow, appending results as chunks finish."""
+    chunk_size = chunk_size or concurrency * 4
+    config = {"max_concurrency": concurrency}
+    pending = read_prompts(input_path, prompt_field, read_completed(output_path))
+    workflow = get_workflow(ASYNC_WORKFLOW, build_async_workflow) if use_async else get_workflow()
+    processed = 0
+
+    with _open_output(output_path) as output:
+        if use_async:
+            processed = asyncio.run(_arun_chunks(workflow, pending, chunk_size, config, output))
+        else:
+            while chunk := list(islice(pending, chunk_size)):
+                inputs = _chunk_inputs(chunk)
+                results = workflow.batch(inputs, config, return_exceptions=True) if inputs else []
+                _write(output, _chunk_records(chunk, results))
+                processed += len(chunk)
+                print(f"Processed {processed} requirement(s).")
+
+    print(format_summary())
+    return processed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("input", help="JSONL file with one requirement per line")
+    parser.add_argument("output", help="JSONL file results are appended to")
+    parser.add_argument("--concurrency", type=int, default=4, help="maximum workflow runs in flight")
+    parser.add_argument("--chunk-size", type=int, help="requirements per checkpointed chunk (default: 4x concurrency)")
+    parser.add_argument("--prompt-field", default="prompt", help="JSON field holding the requirement text")
+    parser.add_argument("--async", dest="use_async", action="store_true", help="drive the async workflow with abatch")
+    args = parser.parse_args()
+
+    run_batch(
+        args.input,
+        args.output,
+        concurrency=args.concurrency,
+        chunk_size=args.chunk_size,
+        prompt_field=args.prompt_field,
+        use_async=args.use_async,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+"""Deterministic stand-ins for Groq and Jira so throughput can be measured offline."""
+import json
+import time
+import zlib
+import random
+import asyncio
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+
+
+class FakeChatModel(BaseChatModel):
+    """Chat model that answers every structured call with `stories` user stories after `latency` seconds."""
+
+    latency: float = 0.05
+    stories: int = 5
+    prompt_tokens: int = 400
+    completion_tokens: int = 600
+    chunk_size: int = 64
+
+    @property
+    def _llm_type(self):
+        return "fake-user-stories"
+
+    def bind_tools(self, tools, **kwargs):
+        return self
+
+    def _arguments(self, messages):
+        seed = zlib.crc32(messages[-1].content.encode()) % 10000
+        return {
+            "stories": [
+                {
+                    "title": f"Story {seed}-{i}",
+                    "description": f"As a user, I want feature {i} so that I get benefit {i}.",
+                    "acceptance_criteria": [f"Criterion {i}.{n}" for n in range(3)],
+                }
+                for i in range(self.stories)
+            ]
+        }
+
+    def _message(self, messages):
+        return AIMessage(
+            content="",
+            tool_calls=[{"name": "UserStories", "args": self._arguments(messages), "id": "call_0"}],
+            usage_metadata={
+                "input_tokens": self.prompt_tokens,
+                "output_tokens": self.completion_tokens,
+                "total_tokens": self.prompt_tokens + self.completion_tokens,
+            },
+            response_metadata={"model_name": self._llm_type},
+        )
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        time.sleep(self.latency)
+        return ChatResult(generations=[ChatGeneration(message=self._message(messages))])
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs):
+        await asyncio.sleep(self.latency)
+        return ChatResult(generations=[ChatGeneration(message=self._message(messages))])
+
+    def _stream(self, messages, stop=None, run_manager=None, **kwargs):
+        arguments = json.dumps(self._arguments(messages))
+        pieces = range(0, len(arguments), self.chunk_size)
+        for n, start in enumerate(pieces):
+            time.sleep(self.latency / len(pieces))
+            chunk = ChatGenerationChunk(message=AIMessageChunk(
+                content="",
+                tool_call_chunks=[{
+                    "name": "UserStories" if n == 0 else None,
+                    "args": arguments[start:start + self.chunk_size],
+                    "id": "call_0" if n == 0 else None,
+                    "index": 0,
+                }],
+            ))
+            if run_manager:
+                run_manager.on_llm_new_token("", chunk=chunk)
+            yield chunk
+
+
+class JiraStub:
+    """Local Jira REST stub that adds `latency` and answers a `rate_limit_ratio` of requests with 429.
+
+    Bulk requests reject the elements numbered in `fail_elements`, the way Jira reports a
+    partial failure, for the first `fail_attempts` bulk requests. Created issues can be
+    read back with GET, and edited or deleted through `issues`.
+    """
+
+    def __init__(self, latency=0.02, rate_limit_ratio=0.0, seed=0, fail_elements=(), fail_attempts=1):
+        self.latency = latency
+        self.rate_limit_ratio = rate_limit_ratio
+        self.fail_elements = set(fail_elements)
+        self.fail_attempts = fail_attempts
+        self.bulk_requests = 0
+        self.requests = 0
+        self.rate_limited = 0
+        self.issues = {}
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self._server.server_port}"
+
+    def start(self):
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _create(self, fields):
+        with self._lock:
+            key = f"LI-{len(self.issues) + 1}"
+            self.issues[key] = fields
+        return self._issue_ref(key)
+
+    def _issue_ref(self, key):
+        return {"id": key.split("-")[1], "key": key, "self": f"{self.url}/rest/api/2/issue/{key}"}
+
+    def _create_bulk(self, updates):
+        with self._lock:
+            self.bulk_requests += 1
+            failing = self.fail_elements if self.bulk_requests <= self.fail_attempts else set()
+        issues, errors = [], []
+        for number, update in enumerate(updates):
+            if number in failing:
+                errors.append({
+                    "status": 400,
+                    "failedElementNumber": number,
+                    "elementErrors": {"errorMessages": [], "errors": {"summary": "Rejected by the stub."}},
+                })
+            else:
+                issues.append(self._create(update["fields"]))
+        return (400 if errors else 201), {"issues": issues, "errors": errors}
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def _reply(self, status, body=None, headers=()):
+                data = json.dumps(body).encode() if body is not None else b""
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                for name, value in headers:
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                time.sleep(stub.latency)
+                with stub._lock:
+                    stub.requests += 1
+                key = self.path.split("?")[0].rstrip("/").rsplit("/", 1)[-1]
+                if "/issue/" not in self.path or key not in stub.issues:
+                    return self._reply(404, {"errorMessages": ["Issue does not exist or you do not have permission to see it."]})
+                self._reply(200, {**stub._issue_ref(key), "fields": stub.issues[key]})
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+                time.sleep(stub.latency)
+                with stub._lock:
+                    stub.requests += 1
+                    limited = stub._random.random() < stub.rate_limit_ratio
+                    stub.rate_limited += limited
+                if limited:
+                    return self._reply(429, {"errorMessages": ["Rate limit exceeded"]}, [("Retry-After", "0")])
+
+                if self.path.rstrip("/").endswith("/issue/bulk"):
+                    return self._reply(*stub._create_bulk(body["issueUpdates"]))
+                if self.path.rstrip("/").endswith("/issue"):
+                    return self._reply(201, stub._create(body["fields"]))
+                self._reply(404, {"errorMessages": ["Not found"]})
+
+        return Handler
@@ -0,0 +1,119 @@
+"""Memory and serialization benchmark for user stories as pydantic models and as story tables.
+
+    python -m benchmarks.serialization --stories 10000 --repeat 5
+
+Results are written to benchmarks/results/ as JSON so runs can be compared over time.
+"""
+import os
+import gc
+import json
+import time
+import argparse
+import tracemalloc
+from datetime import datetime, timezone
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+from benchmarks.throughput import RESULTS_DIR, _git_revision
+from src.graphs.durable_workflow import CHECKPOINT_TYPES
+from src.state.serde import StorySerializer
+from src.state.story_table import StoryTable
+from src.state.user_stories import UserStory, UserStories
+
+
+def make_user_stories(count, criteria=4):
+    return UserStories(stories=[
+        UserStory(
+            title=f"Story {i}: manage user accounts",
+            description=f"As an admin, I want to manage account {i} so that access stays correct.",
+            acceptance_criteria=[f"Criterion {j} for story {i} is met." for j in range(criteria)],
+        )
+        for i in range(count)
+    ])
+
+
+def measure_memory(build):
+    """Bytes still allocated by the object `build()` returns."""
+    gc.collect()
+    tracemalloc.start()
+    obj = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del obj
+    return size
+
+
+def measure_throughput(fn, repeat, count):
+    """Best-of-`repeat` time for `fn()`, as stories per second."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return count / best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--stories", type=int, default=10000, help="stories per payload")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per case; the best one counts")
+    parser.add_argument("--output", help="result file (default: benchmarks/results/<timestamp>.json)")
+    args = parser.parse_args()
+
+    user_stories = make_user_stories(args.stories)
+    table = StoryTable.from_user_stories(user_stories)
+    state = {"user_stories": user_stories}
+    plain = JsonPlusSerializer(allowed_msgpack_modules=CHECKPOINT_TYPES)
+    compact = StorySerializer(allowed_msgpack_modules=CHECKPOINT_TYPES, compact=True)
+    plain_payload = plain.dumps_typed(state)
+    compact_payload = compact.dumps_typed(state)
+    model_json = user_stories.model_dump_json()
+    table_json = table.to_json()
+
+    n = args.stories
+    cases = {
+        "pydantic_validate_json": lambda: UserStories.model_validate_json(model_json),
+        "pydantic_dump_json": user_stories.model_dump_json,
+        "table_to_json": table.to_json,
+        "table_from_json": lambda: StoryTable.from_json(table_json),
+        "table_to_msgpack": table.to_msgpack,
+        "table_to_user_stories": table.to_user_stories,
+        "checkpoint_dumps_plain": lambda: plain.dumps_typed(state),
+        "checkpoint_loads_plain": lambda: plain.loads_typed(plain_payload),
+        "checkpoint_dumps_tables": lambda: compact.dumps_typed(state),
+        "checkpoint_loads_tables": lambda: compact.loads_typed(compact_payload),
+    }
+
+    report = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "revision": _git_revision(),
+        "settings": vars(args),
+        "memory_bytes": {
+            "user_stories": measure_memory(lambda: make_user_stories(n)),
+            "story_table": measure_memory(lambda: StoryTable.from_user_stories(make_user_stories(n))),
+        },
+        "payload_bytes": {
+            "pydantic_json": len(model_json),
+            "table_json": len(table_json),
+            "checkpoint_plain": len(plain_payload[1]),
+            "checkpoint_tables": len(compact_payload[1]),
+        },
+        "stories_per_second": {name: measure_throughput(fn, args.repeat, n) for name, fn in cases.items()},
+    }
+
+    for name, size in report["memory_bytes"].items():
+        print(f"{name:<28}{size / n:>10.0f} bytes/story")
+    for name, size in report["payload_bytes"].items():
+        print(f"{name:<28}{size / n:>10.0f} bytes/story serialized")
+    for name, rate in report["stories_per_second"].items():
+        print(f"{name:<28}{rate:>12,.0f} stories/s")
+
+    output = args.output or os.path.join(
+        RESULTS_DIR, f"serialization-{datetime.now(timezone.utc):%Y%m%dT%H%M%SZ}.json"
+    )
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Measure the import cost of the workflow modules against the cost of building the clients.
+
+Before clients were created lazily, importing the nodes paid for both columns.
+
+    python -m benchmarks.startup --runs 5
+"""
+import os
+import sys
+import argparse
+import statistics
+import subprocess
+
+MODULES = [
+    "src.nodes.user_requirement",
+    "src.tools.create_user_story",
+    "src.graphs.workflow_graph",
+]
+
+CLIENTS = (
+    "from src.llms.providers import get_user_story_evaluator; get_user_story_evaluator(); "
+    "from src.tools.jira_client import get_jira; get_jira()"
+)
+
+TIMER = "import time; start = time.perf_counter(); {code}; print(time.perf_counter() - start)"
+
+
+def _time(code, runs):
+    """Run `code` in fresh interpreters and return the median wall time in milliseconds."""
+    env = {
+        "GROQ_API_KEY": "benchmark",
+        "JIRA_INSTANCE_URL": "http://localhost",
+        **os.environ,
+    }
+    samples = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", TIMER.format(code=code)],
+            capture_output=True, text=True, check=True, env=env,
+        ).stdout
+        samples.append(float(output.strip().splitlines()[-1]) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'module':<32}{'import ms':>12}{'+ clients ms':>15}")
+    for module in MODULES:
+        import_ms = _time(f"import {module}", args.runs)
+        eager_ms = _time(f"import {module}; {CLIENTS}", args.runs)
+        print(f"{module:<32}{import_ms:>12.1f}{eager_ms:>15.1f}")
+
+
+if __name__ == "__main__":
+    main()
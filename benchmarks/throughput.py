@@ -0,0 +1,113 @@
+"""Offline throughput benchmark for the lifecycle workflow, using a fake LLM and a Jira stub.
+
+    python -m benchmarks.throughput --requirements 1,10,100,1000 --concurrency 1,8,32
+
+Results are written to benchmarks/results/ as JSON so runs can be compared over time.
+"""
+import os
+import json
+import time
+import argparse
+import subprocess
+from datetime import datetime, timezone
+from atlassian import Jira
+from benchmarks.fakes import FakeChatModel, JiraStub
+from src.config.constants import Constants
+from src.graphs.workflow_graph import build_workflow
+from src.llms.providers import set_llm
+from src.tools.jira_client import set_jira
+from src.utils.http_pool import get_requests_session, get_pool_stats
+from src.utils.telemetry import metrics
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+
+
+def _git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_scenario(workflow, requirements, concurrency, run_id):
+    """Push `requirements` unique prompts through `workflow` and return throughput and latency figures."""
+    metrics.reset()
+    inputs = [{"prompt": f"Benchmark {run_id} requirement {i}: manage users and roles."} for i in range(requirements)]
+
+    start = time.perf_counter()
+    results = workflow.batch(inputs, {"max_concurrency": concurrency}, return_exceptions=True)
+    seconds = time.perf_counter() - start
+
+    errors = sum(isinstance(result, Exception) for result in results)
+    stories = sum(len(result["jira_results"]) for result in results if not isinstance(result, Exception))
+    return {
+        "requirements": requirements,
+        "concurrency": concurrency,
+        "seconds": seconds,
+        "requirements_per_second": requirements / seconds,
+        "stories_per_second": stories / seconds,
+        "errors": errors,
+        "nodes": metrics.summaries("node_seconds"),
+        "jira": metrics.summaries("jira_request_seconds"),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requirements", default="1,10,100,1000", help="comma-separated requirement counts")
+    parser.add_argument("--concurrency", default="1,8,32", help="comma-separated max_concurrency values")
+    parser.add_argument("--llm-latency", type=float, default=0.05, help="seconds per fake LLM call")
+    parser.add_argument("--stories", type=int, default=5, help="stories generated per requirement")
+    parser.add_argument("--jira-latency", type=float, default=0.02, help="seconds per Jira stub request")
+    parser.add_argument("--jira-429-ratio", type=float, default=0.0, help="share of Jira requests answered with 429")
+    parser.add_argument("--bulk", action="store_true", help="create issues through the bulk endpoint")
+    parser.add_argument("--output", help="result file (default: benchmarks/results/<timestamp>.json)")
+    args = parser.parse_args()
+
+    # Measure the raw pipeline: no caches, no ledger, real HTTP writes to the stub
+    Constants.STORY_CACHE_ENABLED = False
+    Constants.SEMANTIC_CACHE_ENABLED = False
+    Constants.JIRA_LEDGER_ENABLED = False
+    Constants.JIRA_DRY_RUN = False
+    Constants.JIRA_BULK_CREATE = args.bulk
+
+    stub = JiraStub(latency=args.jira_latency, rate_limit_ratio=args.jira_429_ratio).start()
+    set_llm(FakeChatModel(latency=args.llm_latency, stories=args.stories))
+    set_jira(Jira(url=stub.url, username="benchmark", password="benchmark", session=get_requests_session()))
+    workflow = build_workflow()
+
+    scenarios = []
+    try:
+        for requirements in [int(n) for n in args.requirements.split(",")]:
+            for concurrency in [int(n) for n in args.concurrency.split(",")]:
+                result = run_scenario(workflow, requirements, concurrency, len(scenarios))
+                scenarios.append(result)
+                print(
+                    f"requirements={requirements:<5} concurrency={concurrency:<3} "
+                    f"{result['seconds']:8.2f}s {result['requirements_per_second']:8.1f} req/s "
+                    f"{result['stories_per_second']:8.1f} stories/s errors={result['errors']}"
+                )
+    finally:
+        stub.stop()
+
+    report = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "revision": _git_revision(),
+        "settings": vars(args),
+        "jira_stub": {"requests": stub.requests, "rate_limited": stub.rate_limited},
+        "pools": get_pool_stats(),
+        "scenarios": scenarios,
+    }
+    output = args.output or os.path.join(
+        RESULTS_DIR, f"throughput-{datetime.now(timezone.utc):%Y%m%dT%H%M%SZ}.json"
+    )
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,4 @@
 from dotenv import load_dotenv
-from langchain_groq import ChatGroq
-from langchain_openai import ChatOpenAI
 
 # Load env vars
 load_dotenv()
@@ -12,9 +10,37 @@ class LLM:
 
     def initialize_llm(self, name):
         """Initializes and returns an LLM model based on the given name."""
+        # Provider SDKs are imported on demand so importing this module stays cheap
         if name == "openai":
+            from langchain_openai import ChatOpenAI
+
             return ChatOpenAI(model="gpt-4o", temperature=0)
         elif name == "llama":
+            from langchain_groq import ChatGroq
+
             return ChatGroq(model="llama3-70b-8192", temperature=0)
         else:
             raise ValueError(f"Unsupported LLM name: {name}")
+
+    def initialize_router(self, names):
+        """Initializes the first named LLM, falling back to the others in order when a call fails.
+
+        Only rate limits, server errors and connection failures fall back; anything else
+        (bad requests, auth, parsing) is raised.
+        """
+        import groq
+        import openai
+
+        # The ddd app runs from its own folder, so it uses LangChain's fallbacks rather than src's router
+        primary, *fallbacks = [self.initialize_llm(name) for name in names]
+        return primary.with_fallbacks(
+            fallbacks,
+            exceptions_to_handle=(
+                openai.RateLimitError,
+                openai.InternalServerError,
+                openai.APIConnectionError,
+                groq.RateLimitError,
+                groq.InternalServerError,
+                groq.APIConnectionError,
+            ),
+        )
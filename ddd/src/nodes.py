@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import List
 from typing_extensions import TypedDict
 from pydantic import BaseModel, Field
@@ -5,13 +6,18 @@ from pydantic import BaseModel, Field
 from tools import Tool
 from llms import LLM
 
-# Jira Tool
-tool = Tool()
-jira = tool.get_jira_tool()
 
-# Initialize Llama model
-llm = LLM()
-model = llm.initialize_llm("llama")
+@lru_cache(maxsize=None)
+def get_jira():
+    """Returns the Jira tool, creating it on first use."""
+    return Tool().get_jira_tool()
+
+
+@lru_cache(maxsize=None)
+def get_user_story_evaluator():
+    """Returns the Llama model bound to the `UserStories` schema, creating it on first use."""
+    return LLM().initialize_llm("llama").with_structured_output(UserStories)
+
 
 class UserStory(BaseModel):
     title: str = Field(
@@ -29,9 +35,7 @@ class UserStories(BaseModel):
     stories: List[UserStory] = Field(
         default_factory=list, description="List of generated user stories."
     )
-    
-# UserStory schema for structured output
-user_story_evaluator = model.with_structured_output(UserStories)
+
 
 class LifeCycleState(TypedDict):
     prompt: str
@@ -41,7 +45,7 @@ class LifeCycleState(TypedDict):
 
 def get_user_requirements(state: LifeCycleState):
     """Generates structured user stories from user requirements using the `UserStories` schema."""
-    result = user_story_evaluator.invoke(
+    result = get_user_story_evaluator().invoke(
         f"Split the following requirements into distinct user stories. "
         f"Each user story should include a title, description, and acceptance criteria: {state['prompt']}"
     )
@@ -54,7 +58,7 @@ def create_user_stories(state: LifeCycleState):
         return
 
     for story in state["user_stories"].stories:
-        jira.create_user_story(
+        get_jira().create_user_story(
             title=story.title,
             description=story.description,
             acceptance_criteria=story.acceptance_criteria,
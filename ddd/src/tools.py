@@ -1,5 +1,32 @@
 import os
+import requests
 from atlassian import Jira
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def get_requests_session():
+    """Returns a keep-alive session with a sized pool that backs off on rate limits.
+
+    Only 429 and 503 are retried: they mean Jira did not process the request, so
+    resending an issue create cannot make a duplicate. Read errors are never retried.
+    """
+    pool_size = int(os.getenv("HTTP_POOL_SIZE", "20"))
+    retry = Retry(
+        total=int(os.getenv("HTTP_MAX_RETRIES", "3")),
+        read=0,
+        backoff_factor=float(os.getenv("HTTP_BACKOFF_FACTOR", "0.5")),
+        status_forcelist=(429, 503),
+        allowed_methods=None,
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
 
 class JiraTool:
     def __init__(self):
@@ -7,6 +34,7 @@ class JiraTool:
             url=os.getenv("JIRA_INSTANCE_URL"),
             username=os.getenv("JIRA_USERNAME"),
             password=os.getenv("JIRA_API_TOKEN"),
+            session=get_requests_session(),
         )
 
     def create_user_story(self, title, description, acceptance_criteria):
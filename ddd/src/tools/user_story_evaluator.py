@@ -1,13 +1,18 @@
+from functools import lru_cache
 from dotenv import load_dotenv
-from langchain_groq import ChatGroq
 from src.state.user_stories import UserStories
 
 load_dotenv()
 
 
-model = ChatGroq(model="llama3-70b-8192", temperature=0)
-user_story_evaluator = model.with_structured_output(UserStories)
+@lru_cache(maxsize=None)
+def get_user_story_evaluator():
+    """Return the Groq model bound to the `UserStories` schema, creating it on first use."""
+    from langchain_groq import ChatGroq
+
+    model = ChatGroq(model="llama3-70b-8192", temperature=0)
+    return model.with_structured_output(UserStories)
 
 def evaluate_user_stories(query: str) -> UserStories:
     """Generate user stories from a query using the evaluator."""
-    return user_story_evaluator(query)
\ No newline at end of file
+    return get_user_story_evaluator().invoke(query)
\ No newline at end of file
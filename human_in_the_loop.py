@@ -1,10 +1,15 @@
+import uuid
 import streamlit as st
 from dotenv import load_dotenv
 from langchain_groq import ChatGroq
 from langchain_core.messages import HumanMessage, SystemMessage
 from langgraph.graph import MessagesState, StateGraph, START, END
-from langgraph.checkpoint.memory import MemorySaver
-from langgraph.prebuilt import tools_condition, ToolNode
+from langgraph.prebuilt import tools_condition
+from src.config.constants import Constants
+from src.graphs.thread_store import get_thread_store
+from src.tools.tool_executor import ToolExecutor, pure
+from src.utils.context_window import ContextWindow
+from src.utils.event_log import EventLog, jsonl_sink
 
 # Load environment variables
 load_dotenv()
@@ -13,14 +18,17 @@ load_dotenv()
 llm = ChatGroq(model="gemma2-9b-it")
 
 # Define arithmetic operations
+@pure
 def multiply(a: int, b: int) -> int:
     """Multiply two integers."""
     return a * b
 
+@pure
 def add(a: int, b: int) -> int:
     """Add two integers."""
     return a + b
 
+@pure
 def divide(a: int, b: int) -> float:
     """Divide two integers, returning a float."""
     return a / b
@@ -32,14 +40,40 @@ llm_with_tools = llm.bind_tools(tools)
 # Define assistant logic
 sys_msg = SystemMessage(content="You are a helpful assistant tasked with performing arithmetic.")
 
-def assistant(state: MessagesState):
+context_window = ContextWindow(
+    llm,
+    max_turns=Constants.HITL_CONTEXT_TURNS,
+    max_tokens=Constants.HITL_CONTEXT_TOKENS,
+    summary_words=Constants.HITL_SUMMARY_WORDS,
+)
+
+
+class AssistantState(MessagesState):
+    # Running summary of the first `summarized_count` messages, which are no longer sent verbatim
+    summary: str
+    summarized_count: int
+
+
+def assistant(state: AssistantState):
     """Processes user input and returns an AI-generated response."""
-    return {"messages": [llm_with_tools.invoke([sys_msg] + state["messages"])]}
+    prompt, summary, summarized_count = context_window.fit(
+        sys_msg, state["messages"], state.get("summary", ""), state.get("summarized_count", 0)
+    )
+    return {
+        "messages": [llm_with_tools.invoke(prompt)],
+        "summary": summary,
+        "summarized_count": summarized_count,
+    }
+
+@st.cache_resource
+def get_tool_executor():
+    """Runs independent tool calls concurrently; shared across reruns so memoized results survive."""
+    return ToolExecutor(tools, max_concurrency=Constants.HITL_TOOL_CONCURRENCY)
 
 # Build execution graph
-builder = StateGraph(MessagesState)
+builder = StateGraph(AssistantState)
 builder.add_node("assistant", assistant)
-builder.add_node("tools", ToolNode(tools))
+builder.add_node("tools", get_tool_executor())
 
 # builder.add_edge(START, "assistant")
 # builder.add_conditional_edges("assistant", tools_condition)
@@ -54,8 +88,25 @@ builder.add_conditional_edges(
 builder.add_edge("tools", "assistant")
 
 
-memory = MemorySaver()
-graph = builder.compile(interrupt_before=["tools"], checkpointer=memory)
+# Conversations persist in SQLite, shared by every session of this process
+graph = builder.compile(interrupt_before=["tools"], checkpointer=get_thread_store())
+
+
+def stream_updates(graph_input, thread):
+    """Runs the graph, logging only what each node adds, and returns the last message content."""
+    events = EventLog(
+        maxlen=Constants.HITL_EVENT_BUFFER,
+        sink=jsonl_sink(Constants.HITL_EVENT_SINK) if Constants.HITL_EVENT_SINK else None,
+        format_events=Constants.HITL_DEBUG_EVENTS,
+    )
+    response = None
+    for update in graph.stream(graph_input, thread, stream_mode="updates"):
+        for node, delta in update.items():
+            events.add(node, delta)
+            if isinstance(delta, dict) and delta.get("messages"):
+                response = delta["messages"][-1].content
+    return response, events
+
 
 # Streamlit UI
 st.title("Arithmetic Assistant with Human Feedback")
@@ -70,18 +121,16 @@ if 'thread' not in st.session_state:
 
 if st.button("Submit"):
     if user_input:
-        st.session_state.thread = {"configurable": {"thread_id": "1"}}
+        # Each browser session gets its own conversation thread
+        if st.session_state.thread is None:
+            st.session_state.thread = {"configurable": {"thread_id": str(uuid.uuid4())}}
         initial_input = {"messages": HumanMessage(content=user_input)}
         
-        debug_log = ""
-        for event in graph.stream(initial_input, st.session_state.thread, stream_mode="values"):
-            debug_log += f"Event received: {event}\n"
-            if 'messages' in event and event['messages']:
-                st.session_state.response = event['messages'][-1].content
-            else:
-                st.session_state.response = "Error: No response received."
-        
-        st.text(debug_log)  # Print debug info
+        response, events = stream_updates(initial_input, st.session_state.thread)
+        st.session_state.response = response if response is not None else "Error: No response received."
+
+        if Constants.HITL_DEBUG_EVENTS:
+            st.text(events.text())  # Print debug info
 
 st.write("### AI Response:")
 if st.session_state.response.strip():
@@ -94,15 +143,10 @@ feedback = st.radio("Was this answer helpful?", ("👍 Yes", "👎 No"), index=N
 if feedback and st.session_state.thread:
     st.write("Thank you for your feedback!")
     feedback_input = {"messages": HumanMessage(content=f"User feedback: {feedback}")}
-    debug_feedback_log = ""
-    for event in graph.stream(feedback_input, st.session_state.thread, stream_mode="values"):
-        debug_feedback_log += f"Feedback Event: {event}\n"
-        if 'messages' in event and event['messages']:
-            st.session_state.feedback_response = event['messages'][-1].content
-        else:
-            st.session_state.feedback_response = "No response received."
-    
+    response, events = stream_updates(feedback_input, st.session_state.thread)
+    st.session_state.feedback_response = response if response is not None else "No response received."
+
     st.write("### AI Response to Feedback:")
     st.success(st.session_state.feedback_response)
-    st.text(debug_feedback_log)  # Print debug info
-
+    if Constants.HITL_DEBUG_EVENTS:
+        st.text(events.text())  # Print debug info
@@ -1,13 +1,120 @@
+import uuid
 import streamlit as st
+from concurrent.futures import ThreadPoolExecutor
 from src.config.constants import Constants
-from src.graphs.workflow_graph import build_workflow
+from src.graphs.workflow_graph import build_workflow, build_async_workflow
+from src.graphs.workflow_registry import (
+    get_workflow,
+    get_build_time,
+    is_workflow_cached,
+)
+from src.graphs.workflow_stream import stream_user_stories
+from src.nodes.requirement_sections import split_requirement
+from src.nodes.user_story import submit_user_story
+from src.utils.job_executor import get_job_executor, run_graph
+
+ASYNC_WORKFLOW = "async"
+STREAM_WORKFLOW = "stream"
+
+# Nodes on the usual path: user_requirement, create_user_stories
+WORKFLOW_STEPS = 2
 
 
 def run_workflow(prompt: str):
     """Run the software life cycle workflow and return results."""
-    workflow = build_workflow()
-    workflow.invoke({ "prompt": prompt })
-    pass
+    warm = is_workflow_cached()
+    workflow = get_workflow()
+    if warm:
+        print(f"Reused compiled workflow, saved {get_build_time() * 1000:.1f} ms of graph construction.")
+    else:
+        print(f"Compiled workflow in {get_build_time() * 1000:.1f} ms.")
+
+    return workflow.invoke({ "prompt": prompt })
+
+
+async def arun_workflow(prompt: str):
+    """Run the software life cycle workflow without blocking the event loop."""
+    workflow = get_workflow(ASYNC_WORKFLOW, build_async_workflow)
+    return await workflow.ainvoke({"prompt": prompt})
+
+
+def run_workflow_job(job, prompt: str):
+    """Run the workflow as a background job, reporting each finished node."""
+    return run_graph(job, get_workflow(), {"prompt": prompt}, total_steps=WORKFLOW_STEPS)
+
+
+def stream_workflow(job, prompt: str, push_to_jira: bool = False):
+    """Add each user story to the job's partial results as soon as it is generated,
+    optionally creating it in Jira right away.
+
+    A requirement split into sections only gets its final stories once they are merged,
+    and a hedged call may stream the stories of the request that loses, so in both cases
+    the final stories are pushed to Jira after the run instead.
+    """
+    workflow = get_workflow(STREAM_WORKFLOW, lambda: build_workflow(create_issues=False))
+    push_at_end = (
+        Constants.LLM_HEDGE_STORIES
+        or len(split_requirement(prompt, Constants.REQUIREMENT_SECTION_MAX_CHARS)) > 1
+    )
+    final = []
+
+    with ThreadPoolExecutor(max_workers=max(1, Constants.JIRA_MAX_WORKERS)) as executor:
+        futures = []
+        for story in stream_user_stories(workflow, prompt, on_finish=final.append):
+            job.check_cancelled()
+            job.report(message=f"Generated {story.title}", item=story)
+            if push_to_jira and not push_at_end:
+                futures.append(executor.submit(submit_user_story, story))
+
+        if final[0]:
+            # Show what the run settled on: merged sections, or the stories of the winning call
+            job.partial = list(final[0].stories)
+        if push_to_jira and push_at_end and final[0]:
+            job.check_cancelled()
+            futures = [executor.submit(submit_user_story, story) for story in final[0].stories]
+
+    return [future.result() for future in futures]
+
+
+def show_stories(stories):
+    for i, story in enumerate(stories, start=1):
+        st.write(f"**{i}. {story.title}**")
+        st.write(story.description)
+        st.write("**Acceptance Criteria:**")
+        for criterion in story.acceptance_criteria:
+            st.write(f"- {criterion}")
+
+
+@st.fragment(run_every=1.0)
+def show_job():
+    """Poll the session's background job, so the rest of the page stays responsive."""
+    job = get_job_executor().get(st.session_state.get("job_id"))
+    if job is None:
+        return
+
+    if not job.done():
+        st.progress(job.progress, text=job.message or "Working...")
+        if st.button("Cancel"):
+            # Other sessions may share this job; it only stops once all of them cancel
+            if not job.cancel(st.session_state.session_id):
+                st.session_state.job_id = None
+                st.toast("Stopped following this generation; it is still running for other sessions.")
+                return
+        show_stories(job.partial)
+        return
+
+    if job.status == "done":
+        result = job.result()
+        # Streamed jobs collect their stories as they go; full runs return the final state
+        if job.partial:
+            show_stories(job.partial)
+        elif result and result.get("user_stories"):
+            show_stories(result["user_stories"].stories)
+    elif job.status == "cancelled":
+        st.warning("Generation cancelled.")
+        show_stories(job.partial)
+    else:
+        st.error(f"Generation failed: {job.error()}")
 
 
 if __name__ == "__main__":
@@ -16,9 +123,29 @@ if __name__ == "__main__":
     input_prompt = st.text_area(
         "Enter your input requirements:", placeholder=Constants.INPUT_PLACEHOLDER
     )
+    stream = st.checkbox("Show user stories as they are generated", value=True)
+    st.session_state.setdefault("session_id", uuid.uuid4().hex)
 
     if st.button("Generate"):
         if input_prompt:
-            run_workflow(input_prompt)
+            # Identical requests already running are joined instead of started again
+            if stream:
+                job = get_job_executor().submit(
+                    stream_workflow,
+                    input_prompt,
+                    push_to_jira=True,
+                    key=(STREAM_WORKFLOW, input_prompt),
+                    subscriber=st.session_state.session_id,
+                )
+            else:
+                job = get_job_executor().submit(
+                    run_workflow_job,
+                    input_prompt,
+                    key=("default", input_prompt),
+                    subscriber=st.session_state.session_id,
+                )
+            st.session_state.job_id = job.id
         else:
             st.warning("Please enter your requirement!")
+
+    show_job()
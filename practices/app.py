@@ -19,6 +19,13 @@ class UserStories(BaseModel):
     stories: List[UserStory] = Field(default_factory=list, description="List of generated user stories.")
 
 
+class StoryRevisionPlan(BaseModel):
+    """Which existing user stories a piece of feedback affects."""
+    revise: List[int] = Field(default_factory=list, description="Numbers of the stories the feedback asks to change.")
+    remove: List[int] = Field(default_factory=list, description="Numbers of the stories the feedback asks to drop.")
+    add: List[str] = Field(default_factory=list, description="Short summaries of new stories the feedback asks for.")
+
+
 # Properly initialize session state variables
 if "stories" not in st.session_state:
     st.session_state.stories = []  
@@ -34,6 +41,8 @@ if "user_stories_feedback" not in st.session_state:
 
 # UserStory schema for structured output
 user_story_evaluator = llm.with_structured_output(UserStories)
+story_reviser = llm.with_structured_output(UserStory)
+revision_planner = llm.with_structured_output(StoryRevisionPlan)
 
 
 # Graph state
@@ -41,6 +50,9 @@ class State(TypedDict):
     requirement: str
     user_stories: UserStories
     user_stories_review_status: str
+    feedback: str
+    # Positions in `user_stories` that the last revision created or changed
+    revised_story_indexes: List[int]
 
 
 def create_user_stories(state: State):
@@ -54,19 +66,60 @@ def create_user_stories(state: State):
 
 def review_user_stories(state: State):
     """Reviews the generated user stories based on the requirement and feedback."""
-    if st.session_state.user_stories_feedback:
+    if state.get("feedback"):
         return {"user_stories_review_status": "Feedback"}
     return {"user_stories_review_status": "Approved"}
 
 
-def revise_user_stories(state: State):
-    """Revises user stories based on feedback."""
-    feedback = st.session_state.user_stories_feedback
-    revised_result = llm.invoke(
-        f"Revise the following user stories based on the given feedback:\n\nRequirement:\n{state['requirement']}\n\n"
-        f"Feedback:\n{feedback}\n\nUser Stories:\n{state['user_stories']}"
+def plan_story_revision(stories: List[UserStory], feedback: str) -> StoryRevisionPlan:
+    """Asks the LLM which stories the feedback touches, showing it only the story titles."""
+    titles = "\n".join(f"{i + 1}. {story.title}" for i, story in enumerate(stories))
+    plan = revision_planner.invoke(
+        f"Given these user stories and the reviewer's feedback, list the numbers of the stories the feedback "
+        f"asks to change or remove, and summarize any new stories it asks for. Leave out every other story.\n\n"
+        f"User Stories:\n{titles}\n\nFeedback:\n{feedback}"
+    )
+    valid = range(1, len(stories) + 1)
+    return StoryRevisionPlan(
+        revise=sorted({i - 1 for i in plan.revise if i in valid and i not in plan.remove}),
+        remove=sorted({i - 1 for i in plan.remove if i in valid}),
+        add=plan.add,
     )
-    return {"user_stories": revised_result, "user_stories_review_status": "Revised"}
+
+
+def revise_user_stories(state: State):
+    """Revises only the user stories the feedback affects, keeping the rest unchanged."""
+    feedback = state["feedback"]
+    stories = state["user_stories"].stories
+    plan = plan_story_revision(stories, feedback)
+
+    # Regenerate the affected stories and write the new ones in one parallel batch
+    prompts = [
+        f"Revise this user story based on the given feedback. Keep whatever the feedback does not ask to change.\n\n"
+        f"Requirement:\n{state['requirement']}\n\nFeedback:\n{feedback}\n\n"
+        f"User Story:\n{stories[i].model_dump_json()}"
+        for i in plan.revise
+    ] + [
+        f"Write one user story with a title, description, and acceptance criteria for: {summary}\n\n"
+        f"Requirement:\n{state['requirement']}"
+        for summary in plan.add
+    ]
+    generated = story_reviser.batch(prompts) if prompts else []
+
+    # A call that returns no tool call gives None; keep the original story or skip the addition
+    revised = {i: story for i, story in zip(plan.revise, generated) if story is not None}
+    new_stories = [story for story in generated[len(plan.revise):] if story is not None]
+    kept = [(revised.get(i, story), i in revised) for i, story in enumerate(stories) if i not in plan.remove]
+    result = [story for story, _ in kept] + new_stories
+    changed = [i for i, (_, is_revised) in enumerate(kept) if is_revised]
+    changed += list(range(len(kept), len(result)))
+
+    return {
+        "user_stories": UserStories(stories=result),
+        "user_stories_review_status": "Revised",
+        "feedback": "",
+        "revised_story_indexes": changed,
+    }
 
 
 def generate_code(state: State):
@@ -163,4 +216,11 @@ if st.session_state.stories:
 
         if st.button("Submit Feedback"):
             if user_stories_feedback:
-                st.write(user_stories_feedback)
+                st.session_state.state = {
+                    **st.session_state.state,
+                    **revise_user_stories({**st.session_state.state, "feedback": user_stories_feedback}),
+                }
+                st.session_state.stories = st.session_state.state["user_stories"].stories
+                changed = st.session_state.state["revised_story_indexes"]
+                # Only these stories need their Jira issues updated
+                st.write(f"Revised stories: {', '.join(str(i + 1) for i in changed) or 'none'}")
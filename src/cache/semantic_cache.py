@@ -0,0 +1,95 @@
+import re
+import zlib
+import threading
+from src.config.constants import Constants
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def embed(text, dim=4096):
+    """Embed `text` offline with a signed hashing vectorizer over word unigrams and bigrams."""
+    # numpy is imported on first use so importing the workflow does not pay for it while the cache is off
+    import numpy as np
+
+    tokens = TOKEN_PATTERN.findall(text.lower())
+    features = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+
+    vector = np.zeros(dim, dtype=np.float32)
+    for feature in features:
+        h = zlib.crc32(feature.encode())
+        vector[h % dim] += 1.0 if h & 0x80000000 else -1.0
+
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+class SemanticStoryCache:
+    """In-memory nearest-neighbour index from requirement embeddings to generated `UserStories`.
+
+    Embeddings live in one preallocated `(max_entries, dim)` array used as a ring buffer,
+    so adding an entry overwrites the oldest row instead of copying the index.
+    """
+
+    def __init__(self, threshold, max_entries=1000, dim=4096):
+        import numpy as np
+
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.dim = dim
+        self.hits = 0
+        self.misses = 0
+        self._vectors = np.zeros((max_entries, dim), dtype=np.float32)
+        self._stories = [None] * max_entries
+        self._size = 0
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def lookup(self, requirement):
+        """Return `(similarity, UserStories)` for the closest requirement above the threshold, else None."""
+        query = embed(requirement, self.dim)
+        with self._lock:
+            if not self._size:
+                self.misses += 1
+                return None
+
+            # Rows are unit length, so the dot product is the cosine similarity
+            scores = self._vectors[:self._size] @ query
+            best = int(scores.argmax())
+            if scores[best] < self.threshold:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            return float(scores[best]), self._stories[best]
+
+    def add(self, requirement, user_stories):
+        """Index `user_stories` under `requirement`, dropping the oldest entry when full."""
+        vector = embed(requirement, self.dim)
+        with self._lock:
+            self._vectors[self._next] = vector
+            self._stories[self._next] = user_stories
+            self._next = (self._next + 1) % self.max_entries
+            self._size = min(self._size + 1, self.max_entries)
+
+    def stats(self):
+        """Return hit/miss counters and the number of indexed requirements."""
+        return {"hits": self.hits, "misses": self.misses, "size": self._size}
+
+
+_semantic_cache = None
+_semantic_cache_lock = threading.Lock()
+
+
+def get_semantic_cache():
+    """Return the process-wide semantic cache, or None when it is disabled."""
+    global _semantic_cache
+    if not Constants.SEMANTIC_CACHE_ENABLED:
+        return None
+
+    with _semantic_cache_lock:
+        if _semantic_cache is None:
+            _semantic_cache = SemanticStoryCache(
+                threshold=Constants.SEMANTIC_CACHE_THRESHOLD,
+                max_entries=Constants.SEMANTIC_CACHE_MAX_ENTRIES,
+            )
+        return _semantic_cache
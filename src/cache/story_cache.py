@@ -0,0 +1,120 @@
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from src.config.constants import Constants
+from src.llms.providers import get_model_id
+from src.state.user_stories import UserStories
+
+# Changes whenever the `UserStories` schema does, so stale entries stop matching
+SCHEMA_VERSION = hashlib.sha256(
+    json.dumps(UserStories.model_json_schema(), sort_keys=True).encode()
+).hexdigest()[:12]
+
+
+class StoryCache:
+    """SQLite-backed cache of parsed `UserStories`, keyed on model, schema and prompt.
+
+    `model` should name every provider and model that may answer, see `get_model_id`.
+    """
+
+    def __init__(self, path, model, ttl=None, max_entries=None):
+        self.path = path
+        self.model = model
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS user_stories ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+            "created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def make_key(self, prompt):
+        """Hash the model name, schema version and prompt into a cache key."""
+        return hashlib.sha256(f"{self.model}\0{SCHEMA_VERSION}\0{prompt}".encode()).hexdigest()
+
+    def get(self, prompt):
+        """Return the cached `UserStories` for `prompt`, or None on a miss."""
+        key = self.make_key(prompt)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created_at FROM user_stories WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and self.ttl is not None and now - row[1] > self.ttl:
+                self._conn.execute("DELETE FROM user_stories WHERE key = ?", (key,))
+                self._conn.commit()
+                row = None
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            self._conn.execute("UPDATE user_stories SET accessed_at = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+        return UserStories.model_validate_json(row[0])
+
+    def set(self, prompt, user_stories):
+        """Store `user_stories` for `prompt`, evicting expired and least recently used entries."""
+        key = self.make_key(prompt)
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO user_stories (key, value, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, user_stories.model_dump_json(), now, now),
+            )
+            if self.ttl is not None:
+                self._conn.execute("DELETE FROM user_stories WHERE created_at < ?", (now - self.ttl,))
+            if self.max_entries is not None:
+                self._conn.execute(
+                    "DELETE FROM user_stories WHERE key NOT IN "
+                    "(SELECT key FROM user_stories ORDER BY accessed_at DESC LIMIT ?)",
+                    (self.max_entries,),
+                )
+            self._conn.commit()
+
+    def clear(self):
+        """Remove every entry and reset the counters."""
+        with self._lock:
+            self._conn.execute("DELETE FROM user_stories")
+            self._conn.commit()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        """Return hit/miss counters and the number of stored entries."""
+        with self._lock:
+            size = self._conn.execute("SELECT COUNT(*) FROM user_stories").fetchone()[0]
+        return {"hits": self.hits, "misses": self.misses, "size": size}
+
+
+_story_cache = None
+_story_cache_lock = threading.Lock()
+
+
+def get_story_cache():
+    """Return the process-wide story cache, or None when caching is disabled."""
+    global _story_cache
+    if not Constants.STORY_CACHE_ENABLED:
+        return None
+
+    with _story_cache_lock:
+        if _story_cache is None:
+            _story_cache = StoryCache(
+                Constants.STORY_CACHE_PATH,
+                model=get_model_id(),
+                ttl=Constants.STORY_CACHE_TTL,
+                max_entries=Constants.STORY_CACHE_MAX_ENTRIES,
+            )
+        return _story_cache
@@ -1,3 +1,10 @@
+import os
+from dotenv import load_dotenv
+
+# Load env vars
+load_dotenv()
+
+
 class Constants:
     INPUT_PLACEHOLDER = (
         "I want to develop a user management system with two user types: "
@@ -5,3 +12,88 @@ class Constants:
         "update, and delete users, while Users will only be able to retrieve "
         "their own details using their user ID."
     )
+
+    # LLM
+    LLM_MODEL = os.getenv("LLM_MODEL", "llama3-70b-8192")
+    OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-4o")
+
+    # Comma-separated providers; more than one routes calls to the fastest healthy provider
+    LLM_PROVIDERS = os.getenv("LLM_PROVIDERS", "groq")
+    LLM_HEDGE_AFTER = float(os.getenv("LLM_HEDGE_AFTER", "0"))
+
+    # Hedge slow user-story calls with a second request once they pass the recent percentile latency
+    LLM_HEDGE_STORIES = os.getenv("LLM_HEDGE_STORIES", "false").lower() == "true"
+    LLM_HEDGE_PROVIDER = os.getenv("LLM_HEDGE_PROVIDER", "")
+    LLM_HEDGE_PERCENTILE = float(os.getenv("LLM_HEDGE_PERCENTILE", "95"))
+    LLM_HEDGE_MIN_SAMPLES = int(os.getenv("LLM_HEDGE_MIN_SAMPLES", "20"))
+    LLM_HEDGE_INITIAL_DELAY = float(os.getenv("LLM_HEDGE_INITIAL_DELAY", "10"))
+    # Sync calls that lost a race keep running; past this many, calls stop hedging
+    LLM_HEDGE_MAX_LOSERS = int(os.getenv("LLM_HEDGE_MAX_LOSERS", "8"))
+
+    # Client-side rate limits: "" disables them, "memory" shares buckets across threads,
+    # "sqlite" shares them across every process on the host
+    RATE_LIMIT_BACKEND = os.getenv("RATE_LIMIT_BACKEND", "")
+    RATE_LIMIT_DB_PATH = os.getenv("RATE_LIMIT_DB_PATH", ".cache/rate_limits.sqlite")
+    LLM_RATE_LIMITS = {
+        "groq": {"rpm": int(os.getenv("GROQ_RPM", "30")), "tpm": int(os.getenv("GROQ_TPM", "6000"))},
+        "openai": {"rpm": int(os.getenv("OPENAI_RPM", "500")), "tpm": int(os.getenv("OPENAI_TPM", "30000"))},
+    }
+    # Completion tokens charged up front for each LLM call, on top of the prompt estimate
+    LLM_COMPLETION_TOKEN_ESTIMATE = int(os.getenv("LLM_COMPLETION_TOKEN_ESTIMATE", "1000"))
+
+    # Requirements longer than this are split into sections generated in parallel
+    REQUIREMENT_SECTION_MAX_CHARS = int(os.getenv("REQUIREMENT_SECTION_MAX_CHARS", "4000"))
+
+    # Story cache
+    STORY_CACHE_ENABLED = os.getenv("STORY_CACHE_ENABLED", "true").lower() == "true"
+    STORY_CACHE_PATH = os.getenv("STORY_CACHE_PATH", ".cache/user_stories.sqlite")
+    STORY_CACHE_TTL = int(os.getenv("STORY_CACHE_TTL", str(7 * 24 * 60 * 60)))
+    STORY_CACHE_MAX_ENTRIES = int(os.getenv("STORY_CACHE_MAX_ENTRIES", "1000"))
+
+    # Semantic cache: "reuse" returns the cached stories, "seed" revises them
+    SEMANTIC_CACHE_ENABLED = os.getenv("SEMANTIC_CACHE_ENABLED", "false").lower() == "true"
+    SEMANTIC_CACHE_THRESHOLD = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.9"))
+    SEMANTIC_CACHE_MAX_ENTRIES = int(os.getenv("SEMANTIC_CACHE_MAX_ENTRIES", "1000"))
+    SEMANTIC_CACHE_MODE = os.getenv("SEMANTIC_CACHE_MODE", "reuse")
+
+    # Durable workflow checkpoints
+    CHECKPOINT_DB_PATH = os.getenv("CHECKPOINT_DB_PATH", ".cache/checkpoints.sqlite")
+    # Store user stories as column tables: smaller checkpoints, but slower to load
+    CHECKPOINT_COMPACT_STORIES = os.getenv("CHECKPOINT_COMPACT_STORIES", "false").lower() == "true"
+
+    # Human-in-the-loop conversation threads
+    HITL_DB_PATH = os.getenv("HITL_DB_PATH", ".cache/hitl_threads.sqlite")
+    HITL_DB_SHARDS = int(os.getenv("HITL_DB_SHARDS", "1"))
+    HITL_MAX_CACHED_THREADS = int(os.getenv("HITL_MAX_CACHED_THREADS", "256"))
+    HITL_RETENTION_SECONDS = int(os.getenv("HITL_RETENTION_SECONDS", str(7 * 24 * 60 * 60)))
+    # Assistant prompts keep the last turns verbatim and summarize older ones within a token budget
+    HITL_CONTEXT_TURNS = int(os.getenv("HITL_CONTEXT_TURNS", "4"))
+    HITL_CONTEXT_TOKENS = int(os.getenv("HITL_CONTEXT_TOKENS", "3000"))
+    HITL_SUMMARY_WORDS = int(os.getenv("HITL_SUMMARY_WORDS", "150"))
+
+    # Tool calls from one AI message run at the same time, up to this many
+    HITL_TOOL_CONCURRENCY = int(os.getenv("HITL_TOOL_CONCURRENCY", "4"))
+
+    # Graph updates kept for the debug view; HITL_EVENT_SINK also appends them to a JSON-lines file
+    HITL_DEBUG_EVENTS = os.getenv("HITL_DEBUG_EVENTS", "true").lower() == "true"
+    HITL_EVENT_BUFFER = int(os.getenv("HITL_EVENT_BUFFER", "200"))
+    HITL_EVENT_SINK = os.getenv("HITL_EVENT_SINK", "")
+
+    # Background jobs that run workflows off the Streamlit script thread
+    JOB_MAX_WORKERS = int(os.getenv("JOB_MAX_WORKERS", "4"))
+    JOB_RETENTION_SECONDS = int(os.getenv("JOB_RETENTION_SECONDS", "600"))
+
+    # Shared HTTP connection pools
+    HTTP_POOL_SIZE = int(os.getenv("HTTP_POOL_SIZE", "20"))
+    HTTP_KEEPALIVE_EXPIRY = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "30"))
+    HTTP_MAX_RETRIES = int(os.getenv("HTTP_MAX_RETRIES", "3"))
+    HTTP_BACKOFF_FACTOR = float(os.getenv("HTTP_BACKOFF_FACTOR", "0.5"))
+
+    # Jira
+    JIRA_PROJECT_KEY = os.getenv("JIRA_PROJECT_KEY", "LI")
+    JIRA_DRY_RUN = os.getenv("JIRA_DRY_RUN", "true").lower() == "true"
+    JIRA_MAX_WORKERS = int(os.getenv("JIRA_MAX_WORKERS", "8"))
+    JIRA_BULK_CREATE = os.getenv("JIRA_BULK_CREATE", "false").lower() == "true"
+    JIRA_LEDGER_ENABLED = os.getenv("JIRA_LEDGER_ENABLED", "true").lower() == "true"
+    JIRA_REQUESTS_PER_MINUTE = int(os.getenv("JIRA_REQUESTS_PER_MINUTE", "100"))
+    JIRA_LEDGER_PATH = os.getenv("JIRA_LEDGER_PATH", ".cache/jira_ledger.sqlite")
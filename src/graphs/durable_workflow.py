@@ -0,0 +1,92 @@
+import os
+import sqlite3
+import threading
+from langgraph.checkpoint.sqlite import SqliteSaver
+from src.config.constants import Constants
+from src.graphs.workflow_graph import build_workflow
+from src.graphs.workflow_registry import get_workflow
+from src.state.serde import StorySerializer
+
+DURABLE_WORKFLOW = "durable"
+
+# State types the checkpointer may rebuild when loading a checkpoint
+CHECKPOINT_TYPES = [
+    ("src.state.user_stories", "UserStories"),
+    ("src.state.user_stories", "UserStory"),
+]
+
+_lock = threading.Lock()
+_checkpointer = None
+
+
+def get_checkpointer():
+    """Return the process-wide SQLite checkpointer, opening the database on first use."""
+    global _checkpointer
+    with _lock:
+        if _checkpointer is None:
+            path = Constants.CHECKPOINT_DB_PATH
+            if os.path.dirname(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+            conn = sqlite3.connect(path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            _checkpointer = SqliteSaver(
+                conn,
+                serde=StorySerializer(
+                    allowed_msgpack_modules=CHECKPOINT_TYPES, compact=Constants.CHECKPOINT_COMPACT_STORIES
+                ),
+            )
+        return _checkpointer
+
+
+def get_durable_workflow():
+    """Return the compiled workflow that checkpoints every step to SQLite."""
+    return get_workflow(DURABLE_WORKFLOW, lambda: build_workflow(checkpointer=get_checkpointer()))
+
+
+def _config(thread_id):
+    return {"configurable": {"thread_id": thread_id}}
+
+
+def run_durable_workflow(prompt, thread_id):
+    """Run the workflow for `prompt`, checkpointing under `thread_id` so it can be resumed.
+
+    Reusing a thread starts a fresh run: stories and Jira results of the previous run are cleared.
+    """
+    fresh = {"prompt": prompt, "user_stories": None, "section_stories": None, "jira_results": []}
+    return get_durable_workflow().invoke(fresh, _config(thread_id))
+
+
+def failed_stories(values):
+    """Return the titles of stories whose Jira issue has not been created."""
+    stories = values["user_stories"].stories if values.get("user_stories") else []
+    results = values.get("jira_results") or []
+    return [
+        story.title for i, story in enumerate(stories)
+        if i >= len(results) or results[i]["error"] is not None
+    ]
+
+
+def resume_workflow(thread_id):
+    """Resume `thread_id` from its last checkpoint, creating only the stories still missing.
+
+    Stories already generated are reused, so the LLM is not called again. Jira results are
+    checkpointed when the whole create step returns, not per story; after a crash inside
+    that step, stories it had already created are skipped through the Jira ledger
+    (`JIRA_LEDGER_ENABLED`), not the checkpoint.
+    """
+    workflow = get_durable_workflow()
+    config = _config(thread_id)
+    snapshot = workflow.get_state(config)
+    if not snapshot.values:
+        raise ValueError(f"No checkpoint found for thread '{thread_id}'.")
+
+    # Interrupted mid-run: continue from the step that did not finish
+    if snapshot.next:
+        return workflow.invoke(None, config)
+
+    if not failed_stories(snapshot.values):
+        return snapshot.values
+
+    # Finished with failures: re-enter just before Jira creation with the stored stories
+    workflow.update_state(config, None, as_node="user_requirement")
+    return workflow.invoke(None, config)
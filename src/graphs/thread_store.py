@@ -0,0 +1,193 @@
+import os
+import json
+import time
+import zlib
+import sqlite3
+import threading
+from collections import OrderedDict
+from langgraph.checkpoint.base import (
+    BaseCheckpointSaver,
+    CheckpointTuple,
+    copy_checkpoint,
+    get_checkpoint_metadata,
+)
+from langgraph.checkpoint.sqlite import SqliteSaver
+from src.config.constants import Constants
+
+
+def _thread_id(config):
+    return str(config["configurable"]["thread_id"])
+
+
+def _shard_path(path, shard, shards):
+    if shards == 1:
+        return path
+    root, ext = os.path.splitext(path)
+    return f"{root}-{shard}{ext}"
+
+
+def _copy(saved):
+    # The graph loop updates the checkpoint it loads in place; cached tuples must not change
+    return saved._replace(checkpoint=copy_checkpoint(saved.checkpoint))
+
+
+class ThreadStore(BaseCheckpointSaver):
+    """SQLite checkpointer for many concurrent conversation threads.
+
+    Threads are spread over `shards` WAL-mode database files by a hash of their id, so
+    writers on different threads rarely contend. The latest checkpoint of the
+    `max_cached_threads` most recently used threads stays in memory; idle threads are
+    evicted and read back from disk. `prune_idle` deletes threads nobody used recently.
+    """
+
+    def __init__(self, path, shards=1, max_cached_threads=256, serde=None):
+        super().__init__(serde=serde)
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.shards = []
+        for shard in range(shards):
+            conn = sqlite3.connect(_shard_path(path, shard, shards), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS thread_activity (thread_id TEXT PRIMARY KEY, updated REAL NOT NULL)"
+            )
+            conn.commit()
+            self.shards.append(SqliteSaver(conn, serde=self.serde))
+        self.max_cached_threads = max_cached_threads
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _shard(self, thread_id):
+        return self.shards[zlib.crc32(str(thread_id).encode()) % len(self.shards)]
+
+    def _remember(self, key, saved):
+        with self._cache_lock:
+            self._cache[key] = _copy(saved)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_cached_threads:
+                self._cache.popitem(last=False)
+
+    def _forget(self, thread_id):
+        with self._cache_lock:
+            for key in [key for key in self._cache if key[0] == thread_id]:
+                del self._cache[key]
+
+    def _touch(self, thread_id):
+        with self._shard(thread_id).cursor() as cur:
+            cur.execute(
+                "INSERT OR REPLACE INTO thread_activity (thread_id, updated) VALUES (?, ?)",
+                (thread_id, time.time()),
+            )
+
+    def get_tuple(self, config):
+        thread_id = _thread_id(config)
+        if config["configurable"].get("checkpoint_id"):
+            return self._shard(thread_id).get_tuple(config)
+
+        key = (thread_id, config["configurable"].get("checkpoint_ns", ""))
+        with self._cache_lock:
+            saved = self._cache.get(key)
+            if saved is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return _copy(saved)
+            self.misses += 1
+
+        saved = self._shard(thread_id).get_tuple(config)
+        if saved is not None:
+            self._remember(key, saved)
+        return saved
+
+    def list(self, config, *, filter=None, before=None, limit=None):
+        shards = [self._shard(_thread_id(config))] if config else self.shards
+        for shard in shards:
+            for saved in shard.list(config, filter=filter, before=before, limit=limit):
+                yield saved
+                if limit is not None:
+                    limit -= 1
+                    if limit <= 0:
+                        return
+
+    def put(self, config, checkpoint, metadata, new_versions):
+        """Save `checkpoint` and cache it as the thread's latest, so the next turn reads no disk."""
+        thread_id = _thread_id(config)
+        self._forget(thread_id)
+        next_config = self._shard(thread_id).put(config, checkpoint, metadata, new_versions)
+        self._touch(thread_id)
+
+        parent_id = config["configurable"].get("checkpoint_id")
+        parent_config = {"configurable": {**next_config["configurable"], "checkpoint_id": parent_id}}
+        self._remember(
+            (thread_id, next_config["configurable"]["checkpoint_ns"]),
+            CheckpointTuple(
+                config=next_config,
+                checkpoint=checkpoint,
+                # Stored as JSON, so cache what a read from disk would return
+                metadata=json.loads(json.dumps(get_checkpoint_metadata(config, metadata))),
+                parent_config=parent_config if parent_id else None,
+                pending_writes=[],
+            ),
+        )
+        return next_config
+
+    def put_writes(self, config, writes, task_id, task_path=""):
+        # Writes attach to the cached checkpoint; it is cached again by the next `put`
+        thread_id = _thread_id(config)
+        self._forget(thread_id)
+        self._shard(thread_id).put_writes(config, writes, task_id, task_path)
+
+    def delete_thread(self, thread_id):
+        thread_id = str(thread_id)
+        self._forget(thread_id)
+        shard = self._shard(thread_id)
+        shard.delete_thread(thread_id)
+        with shard.cursor() as cur:
+            cur.execute("DELETE FROM thread_activity WHERE thread_id = ?", (thread_id,))
+
+    def get_next_version(self, current, channel):
+        return self.shards[0].get_next_version(current, channel)
+
+    def prune_idle(self, max_age):
+        """Delete every thread not written to in the last `max_age` seconds; return how many."""
+        cutoff = time.time() - max_age
+        thread_ids = []
+        for shard in self.shards:
+            with shard.cursor(transaction=False) as cur:
+                cur.execute("SELECT thread_id FROM thread_activity WHERE updated < ?", (cutoff,))
+                thread_ids.extend(row[0] for row in cur.fetchall())
+        for thread_id in thread_ids:
+            self.delete_thread(thread_id)
+        return len(thread_ids)
+
+    def stats(self):
+        """Return cache hit/miss counts and how many threads are cached."""
+        with self._cache_lock:
+            return {"hits": self.hits, "misses": self.misses, "cached_threads": len(self._cache)}
+
+
+# How often get_thread_store runs retention pruning
+PRUNE_INTERVAL = 60 * 60
+
+_lock = threading.Lock()
+_store = None
+_last_prune = None
+
+
+def get_thread_store():
+    """Return the process-wide conversation thread store, pruning expired threads at most hourly."""
+    global _store, _last_prune
+    with _lock:
+        if _store is None:
+            _store = ThreadStore(
+                Constants.HITL_DB_PATH,
+                shards=Constants.HITL_DB_SHARDS,
+                max_cached_threads=Constants.HITL_MAX_CACHED_THREADS,
+            )
+        if _last_prune is None or time.monotonic() - _last_prune > PRUNE_INTERVAL:
+            _last_prune = time.monotonic()
+            pruned = _store.prune_idle(Constants.HITL_RETENTION_SECONDS)
+            if pruned:
+                print(f"Pruned {pruned} idle conversation threads.")
+        return _store
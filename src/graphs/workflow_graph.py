@@ -1,22 +1,52 @@
 from langgraph.graph import StateGraph, START, END
 from src.state.agent_state import LifeCycleState
-from src.nodes.user_requirement import get_user_requirement
-from src.nodes.user_story import create_user_stories
+from src.nodes.user_requirement import get_user_requirement, aget_user_requirement
+from src.nodes.requirement_sections import (
+    route_requirement,
+    get_section_user_stories,
+    aget_section_user_stories,
+    merge_section_stories,
+)
+from src.nodes.user_story import create_user_stories, acreate_user_stories
+from src.utils.telemetry import instrument_node
 
 
-def build_workflow():
-    """Build the workflow graph."""
+def _build_workflow(user_requirement_node, section_node, create_user_stories_node, create_issues, checkpointer=None):
+    """Wire the life cycle nodes into a compiled graph."""
 
     # Build workflow
     workflow_builder = StateGraph(LifeCycleState)
 
-    # Add nodes
-    workflow_builder.add_node("user_requirement", get_user_requirement)
-    workflow_builder.add_node('create_user_stories', create_user_stories)
+    # Add nodes, each instrumented for latency, tokens, Jira calls and story count
+    workflow_builder.add_node("user_requirement", instrument_node("user_requirement", user_requirement_node))
+    workflow_builder.add_node("user_story_section", instrument_node("user_story_section", section_node))
+    workflow_builder.add_node("merge_section_stories", instrument_node("merge_section_stories", merge_section_stories))
+    if create_issues:
+        workflow_builder.add_node('create_user_stories', instrument_node("create_user_stories", create_user_stories_node))
+    stories_done = "create_user_stories" if create_issues else END
 
-    # Add edges to connect nodes
-    workflow_builder.add_edge(START, "user_requirement")
-    workflow_builder.add_edge("user_requirement", "create_user_stories")
-    workflow_builder.add_edge("create_user_stories", END)
+    # Add edges to connect nodes; large requirements fan out one branch per section
+    workflow_builder.add_conditional_edges(
+        START, route_requirement, ["user_requirement", "user_story_section"]
+    )
+    workflow_builder.add_edge("user_story_section", "merge_section_stories")
+    workflow_builder.add_edge("merge_section_stories", stories_done)
+    workflow_builder.add_edge("user_requirement", stories_done)
+    if create_issues:
+        workflow_builder.add_edge("create_user_stories", END)
 
-    return workflow_builder.compile()
+    return workflow_builder.compile(checkpointer=checkpointer)
+
+
+def build_workflow(create_issues=True, checkpointer=None):
+    """Build the workflow graph; without `create_issues` it stops once stories are generated."""
+    return _build_workflow(
+        get_user_requirement, get_section_user_stories, create_user_stories, create_issues, checkpointer
+    )
+
+
+def build_async_workflow(create_issues=True, checkpointer=None):
+    """Build the workflow graph with async nodes, for use with `ainvoke`/`astream`."""
+    return _build_workflow(
+        aget_user_requirement, aget_section_user_stories, acreate_user_stories, create_issues, checkpointer
+    )
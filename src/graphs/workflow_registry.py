@@ -0,0 +1,53 @@
+import time
+import threading
+from src.graphs.workflow_graph import build_workflow
+
+DEFAULT_WORKFLOW = "default"
+
+_lock = threading.Lock()
+_workflows = {}
+_build_times = {}
+_invalidation_hooks = []
+
+
+def get_workflow(key=DEFAULT_WORKFLOW, builder=build_workflow):
+    """Return the compiled workflow for `key`, building it on first use."""
+    workflow = _workflows.get(key)
+    if workflow is not None:
+        return workflow
+
+    with _lock:
+        if key not in _workflows:
+            start = time.perf_counter()
+            _workflows[key] = builder()
+            _build_times[key] = time.perf_counter() - start
+        return _workflows[key]
+
+
+def get_build_time(key=DEFAULT_WORKFLOW):
+    """Return the seconds spent compiling the workflow for `key`, if built."""
+    return _build_times.get(key)
+
+
+def is_workflow_cached(key=DEFAULT_WORKFLOW):
+    """Check whether a compiled workflow is already cached for `key`."""
+    return key in _workflows
+
+
+def on_invalidate(hook):
+    """Register `hook(key)` to be called whenever a cached workflow is dropped."""
+    _invalidation_hooks.append(hook)
+    return hook
+
+
+def invalidate_workflow(key=None):
+    """Drop the cached workflow for `key`, or every cached workflow when `key` is None."""
+    with _lock:
+        keys = list(_workflows) if key is None else [key] if key in _workflows else []
+        for k in keys:
+            _workflows.pop(k, None)
+            _build_times.pop(k, None)
+
+    for k in keys:
+        for hook in _invalidation_hooks:
+            hook(k)
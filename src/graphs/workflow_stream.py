@@ -0,0 +1,109 @@
+from collections import Counter
+from langchain_core.utils.json import parse_partial_json
+from pydantic import ValidationError
+from src.state.user_stories import UserStory
+
+# Nodes whose model calls produce `UserStories` tool-call arguments
+STORY_NODES = ("user_requirement", "user_story_section")
+
+
+class StoryStreamParser:
+    """Incrementally parses streamed `UserStories` tool-call arguments into complete stories."""
+
+    def __init__(self):
+        self._args = {}
+        self._calls = {}
+        self._emitted = {}
+        self._section_titles = {}
+        self._streamed = Counter()
+
+    def feed(self, chunk, metadata):
+        """Consume one message chunk and return the stories it completed."""
+        node = metadata.get("langgraph_node")
+        if node not in STORY_NODES:
+            return []
+
+        # Parallel section calls stream interleaved, and a hedged call streams twice into
+        # one namespace, so arguments are collected per model call
+        namespace = metadata.get("langgraph_checkpoint_ns", "")
+        call = getattr(chunk, "id", None) or namespace
+        for tool_chunk in getattr(chunk, "tool_call_chunks", None) or []:
+            self._args[call] = self._args.get(call, "") + (tool_chunk.get("args") or "")
+        if not self._args.get(call):
+            return []
+
+        # Follow one call per namespace; the other half of a hedge would repeat its stories
+        if self._calls.setdefault(namespace, call) != call:
+            return []
+
+        parsed = parse_partial_json(self._args[call])
+        stories = (parsed or {}).get("stories") or []
+
+        # Every object before the last one in the array is complete
+        new_stories = []
+        for data in stories[self._emitted.get(namespace, 0):-1]:
+            self._emitted[namespace] = self._emitted.get(namespace, 0) + 1
+            try:
+                story = UserStory.model_validate(data)
+            except ValidationError:
+                continue
+            key = _title_key(story)
+            # Sections that describe the same story are merged at the end; show it once
+            if node == "user_story_section" and self._section_titles.setdefault(key, namespace) != namespace:
+                continue
+            self._streamed[key] += 1
+            new_stories.append(story)
+        return new_stories
+
+    def finish(self, user_stories):
+        """Return the stories in the final `UserStories` that were not streamed yet."""
+        if user_stories is None:
+            return []
+        remaining = []
+        for story in user_stories.stories:
+            key = _title_key(story)
+            if self._streamed[key]:
+                self._streamed[key] -= 1
+            else:
+                remaining.append(story)
+        return remaining
+
+
+def _title_key(story):
+    return story.title.strip().lower()
+
+
+def stream_user_stories(workflow, prompt, on_finish=None):
+    """Yield each `UserStory` from `workflow` as soon as its JSON object is complete.
+
+    `on_finish` is called with the final `UserStories` of the run. For a requirement split
+    into sections those are the merged stories, which the streamed ones are not.
+    """
+    parser = StoryStreamParser()
+    final = None
+    for mode, data in workflow.stream({"prompt": prompt}, stream_mode=["messages", "values"]):
+        if mode == "messages":
+            yield from parser.feed(*data)
+        else:
+            final = data
+    user_stories = (final or {}).get("user_stories")
+    yield from parser.finish(user_stories)
+    if on_finish:
+        on_finish(user_stories)
+
+
+async def astream_user_stories(workflow, prompt, on_finish=None):
+    """Async variant of `stream_user_stories` built on `astream`."""
+    parser = StoryStreamParser()
+    final = None
+    async for mode, data in workflow.astream({"prompt": prompt}, stream_mode=["messages", "values"]):
+        if mode == "messages":
+            for story in parser.feed(*data):
+                yield story
+        else:
+            final = data
+    user_stories = (final or {}).get("user_stories")
+    for story in parser.finish(user_stories):
+        yield story
+    if on_finish:
+        on_finish(user_stories)
@@ -0,0 +1,238 @@
+import time
+import asyncio
+import threading
+import contextvars
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from langchain_core.runnables import Runnable
+from src.utils.telemetry import metrics
+
+# `loser` is the still-running primary future when the backup won a sync race
+HedgeOutcome = namedtuple("HedgeOutcome", ["result", "winner", "hedged", "loser"])
+
+
+class InvalidResultError(Exception):
+    """Raised when neither request in a race produced an acceptable result."""
+
+
+def _always(_):
+    return True
+
+
+def _not_none(result):
+    return result is not None
+
+
+class HedgePool:
+    """Threads for the sync races of one hedging layer, with a cap on abandoned losers.
+
+    Every layer that races (a hedged runnable, a router) needs its own pool: a race blocks
+    its caller until a call in the pool finishes, so layers nested on one shared pool can
+    fill it with races waiting on calls that never get a thread. Losing calls cannot be
+    interrupted; once `max_losers` of them are still running, races stop hedging until
+    some finish.
+    """
+
+    def __init__(self, max_workers=32, max_losers=8, name="llm-hedge"):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name)
+        self.max_losers = max_losers
+        self._losers = 0
+        self._lock = threading.Lock()
+
+    def submit(self, fn):
+        # Run in a copy of the caller's context so callbacks and tracing follow the call
+        return self._executor.submit(contextvars.copy_context().run, fn)
+
+    def can_hedge(self):
+        with self._lock:
+            return self._losers < self.max_losers
+
+    def abandon(self, future):
+        """Count `future` as a running loser until it finishes."""
+        with self._lock:
+            self._losers += 1
+        future.add_done_callback(self._finished)
+
+    def _finished(self, _):
+        with self._lock:
+            self._losers -= 1
+
+    def losers(self):
+        with self._lock:
+            return self._losers
+
+
+def race(primary, backup, delay, pool, accept=_not_none, retry=_always):
+    """Call `primary`, and `backup` as well if it has not answered within `delay` seconds.
+
+    The first accepted result wins. A primary that fails fast with an error `retry`
+    allows starts the backup straight away; any other error is raised. Calls run in
+    `pool`, which should belong to the caller alone; see `HedgePool`.
+    """
+    first = pool.submit(primary)
+    futures = [first]
+    done, _ = wait(futures, timeout=delay)
+    hedged = not done and pool.can_hedge()
+    if hedged:
+        futures.append(pool.submit(backup))
+    elif not done:
+        metrics.increment("llm_hedges_skipped")
+    elif first.exception() is not None or not accept(first.result()):
+        if first.exception() is not None and not retry(first.exception()):
+            raise first.exception()
+        futures.append(pool.submit(backup))
+
+    error = None
+    pending = set(futures)
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            if future.exception() is None and accept(future.result()):
+                # Threads cannot be interrupted; a losing call finishes and is discarded
+                loser = next(iter(pending), None)
+                if loser is not None:
+                    pool.abandon(loser)
+                return HedgeOutcome(future.result(), futures.index(future), hedged, loser)
+            error = future.exception() or error
+    raise error or InvalidResultError("No request returned a valid result.")
+
+
+async def arace(primary, backup, delay, accept=_not_none, retry=_always):
+    """Async variant of `race`; `primary` and `backup` are coroutine functions and the loser is cancelled."""
+    first = asyncio.ensure_future(primary())
+    tasks = [first]
+    done, _ = await asyncio.wait(tasks, timeout=delay)
+    hedged = not done
+    if not done:
+        tasks.append(asyncio.ensure_future(backup()))
+    elif first.exception() is not None or not accept(first.result()):
+        if first.exception() is not None and not retry(first.exception()):
+            raise first.exception()
+        tasks.append(asyncio.ensure_future(backup()))
+
+    error = None
+    pending = set(tasks)
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None and accept(task.result()):
+                    return HedgeOutcome(task.result(), tasks.index(task), hedged, None)
+                error = task.exception() or error
+        raise error or InvalidResultError("No request returned a valid result.")
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+class LatencyWindow:
+    """Rolling window of latencies with percentile lookups."""
+
+    def __init__(self, size=200):
+        self._samples = deque(maxlen=size)
+        self._lock = threading.Lock()
+
+    def add(self, seconds):
+        with self._lock:
+            self._samples.append(seconds)
+
+    def __len__(self):
+        return len(self._samples)
+
+    def percentile(self, q):
+        with self._lock:
+            ordered = sorted(self._samples)
+        if not ordered:
+            return None
+        return ordered[min(len(ordered) - 1, int(q / 100 * len(ordered)))]
+
+
+class HedgedRunnable(Runnable):
+    """Fires a second request when the first is slower than the recent `percentile` latency.
+
+    `backup` may be the same runnable or one for an alternate model. The first valid
+    result wins. Until `min_samples` calls have been seen, `initial_delay` is used.
+    """
+
+    def __init__(
+        self, primary, backup=None, percentile=95, min_samples=20, initial_delay=10.0, accept=_not_none, max_losers=8
+    ):
+        self.primary = primary
+        self.backup = backup or primary
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.initial_delay = initial_delay
+        self.accept = accept
+        self.primary_latency = LatencyWindow()
+        self.latency = LatencyWindow()
+        self.pool = HedgePool(max_losers=max_losers, name="llm-hedge")
+        self._lock = threading.Lock()
+        self._counts = {"calls": 0, "hedged": 0, "backup_wins": 0, "saved_seconds": 0.0}
+
+    def hedge_delay(self):
+        """Seconds to wait before hedging, from the recent primary latency distribution."""
+        if len(self.primary_latency) < self.min_samples:
+            return self.initial_delay
+        return self.primary_latency.percentile(self.percentile)
+
+    def _count(self, outcome, start):
+        elapsed = time.monotonic() - start
+        self.latency.add(elapsed)
+        with self._lock:
+            self._counts["calls"] += 1
+            self._counts["hedged"] += outcome.hedged
+            self._counts["backup_wins"] += outcome.winner == 1
+        metrics.observe("llm_hedged_call_seconds", elapsed)
+        if outcome.hedged:
+            metrics.increment("llm_story_hedges", winner="backup" if outcome.winner else "primary")
+        if outcome.winner == 0:
+            self.primary_latency.add(elapsed)
+        elif outcome.loser is not None:
+            # Once the abandoned primary finishes, credit the time the backup saved
+            def finished(_):
+                primary_elapsed = time.monotonic() - start
+                self.primary_latency.add(primary_elapsed)
+                with self._lock:
+                    self._counts["saved_seconds"] += primary_elapsed - elapsed
+
+            outcome.loser.add_done_callback(finished)
+        elif outcome.hedged:
+            # A cancelled primary took at least this long, which keeps the window honest
+            self.primary_latency.add(elapsed)
+
+    def invoke(self, input, config=None, **kwargs):
+        start = time.monotonic()
+        outcome = race(
+            lambda: self.primary.invoke(input, config, **kwargs),
+            lambda: self.backup.invoke(input, config, **kwargs),
+            self.hedge_delay(),
+            accept=self.accept,
+            pool=self.pool,
+        )
+        self._count(outcome, start)
+        return outcome.result
+
+    async def ainvoke(self, input, config=None, **kwargs):
+        start = time.monotonic()
+        outcome = await arace(
+            lambda: self.primary.ainvoke(input, config, **kwargs),
+            lambda: self.backup.ainvoke(input, config, **kwargs),
+            self.hedge_delay(),
+            accept=self.accept,
+        )
+        self._count(outcome, start)
+        return outcome.result
+
+    def stats(self):
+        """Return hedge rate, backup wins, measured savings and tail latencies."""
+        with self._lock:
+            counts = dict(self._counts)
+        calls = counts["calls"] or 1
+        return {
+            **counts,
+            "hedge_rate": counts["hedged"] / calls,
+            "hedge_delay": self.hedge_delay(),
+            "p99_primary": self.primary_latency.percentile(99),
+            "p99_hedged": self.latency.percentile(99),
+            "running_losers": self.pool.losers(),
+        }
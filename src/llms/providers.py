@@ -0,0 +1,115 @@
+import threading
+from src.config.constants import Constants
+from src.llms.hedging import HedgedRunnable
+from src.llms.router import LLMRouter
+from src.state.user_stories import UserStories
+from src.utils.http_pool import get_httpx_client
+from src.utils.rate_limiter import RateLimitedRunnable
+
+# A router fails over and cools a provider down itself, so SDK retries would only delay that
+ROUTED_MAX_RETRIES = 0
+
+_lock = threading.RLock()
+_llm = None
+_user_story_evaluator = None
+
+
+def _provider_names():
+    return [name.strip() for name in Constants.LLM_PROVIDERS.split(",") if name.strip()]
+
+
+def _model_name(name):
+    return {"groq": Constants.LLM_MODEL, "openai": Constants.OPENAI_MODEL}.get(name, name)
+
+
+def get_model_id():
+    """Identify every provider and model the user-story calls may use, e.g. for cache keys."""
+    names = _provider_names()
+    if Constants.LLM_HEDGE_STORIES and Constants.LLM_HEDGE_PROVIDER:
+        names.append(Constants.LLM_HEDGE_PROVIDER)
+    return ",".join(f"{name}:{_model_name(name)}" for name in dict.fromkeys(names))
+
+
+def _create_provider(name, max_retries=None):
+    """Create the rate-limited chat model for one provider name, sharing the pooled sync HTTP client.
+
+    `max_retries` caps the SDK's own retries and defaults to `HTTP_MAX_RETRIES`.
+    """
+    if max_retries is None:
+        max_retries = Constants.HTTP_MAX_RETRIES
+    return RateLimitedRunnable(_create_model(name, max_retries), name)
+
+
+def _create_model(name, max_retries):
+    # Provider SDKs are imported here so loading the workflow does not pay for them
+    if name == "groq":
+        from langchain_groq import ChatGroq
+
+        return ChatGroq(
+            model=_model_name(name),
+            temperature=0,
+            max_retries=max_retries,
+            http_client=get_httpx_client(),
+        )
+    elif name == "openai":
+        from langchain_openai import ChatOpenAI
+
+        return ChatOpenAI(
+            model=_model_name(name),
+            temperature=0,
+            max_retries=max_retries,
+            http_client=get_httpx_client(),
+        )
+    else:
+        raise ValueError(f"Unsupported LLM provider: {name}")
+
+
+def get_llm():
+    """Return the process-wide chat model, creating it on first use.
+
+    With several `LLM_PROVIDERS` configured this is an `LLMRouter` over all of them.
+    """
+    global _llm
+    with _lock:
+        if _llm is None:
+            names = _provider_names()
+            if len(names) == 1:
+                _llm = _create_provider(names[0])
+            else:
+                _llm = LLMRouter(
+                    {name: _create_provider(name, ROUTED_MAX_RETRIES) for name in names},
+                    hedge_after=Constants.LLM_HEDGE_AFTER or None,
+                    max_losers=Constants.LLM_HEDGE_MAX_LOSERS,
+                )
+        return _llm
+
+
+def get_user_story_evaluator():
+    """Return the chat model bound to the `UserStories` structured-output schema."""
+    global _user_story_evaluator
+    with _lock:
+        if _user_story_evaluator is None:
+            evaluator = get_llm().with_structured_output(UserStories)
+            if Constants.LLM_HEDGE_STORIES:
+                backup = evaluator
+                if Constants.LLM_HEDGE_PROVIDER:
+                    backup = _create_provider(Constants.LLM_HEDGE_PROVIDER).with_structured_output(UserStories)
+                evaluator = HedgedRunnable(
+                    evaluator,
+                    backup,
+                    percentile=Constants.LLM_HEDGE_PERCENTILE,
+                    min_samples=Constants.LLM_HEDGE_MIN_SAMPLES,
+                    initial_delay=Constants.LLM_HEDGE_INITIAL_DELAY,
+                    accept=lambda result: isinstance(result, UserStories),
+                    max_losers=Constants.LLM_HEDGE_MAX_LOSERS,
+                )
+            _user_story_evaluator = evaluator
+        return _user_story_evaluator
+
+
+def set_llm(llm):
+    """Replace the chat model, e.g. with a fake in tests; None resets to the default."""
+    global _llm, _user_story_evaluator
+    with _lock:
+        _llm = llm
+        _user_story_evaluator = None
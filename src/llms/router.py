@@ -0,0 +1,213 @@
+import time
+import httpx
+import threading
+from collections import deque
+from langchain_core.runnables import Runnable
+from src.llms.hedging import HedgePool, race, arace
+from src.utils.telemetry import metrics
+
+# Statuses that mean "try another provider" rather than "the request is wrong"
+FAILOVER_STATUSES = {408, 409, 429, 500, 502, 503, 504, 529}
+
+
+def _accept_any(_):
+    return True
+
+
+def error_status(error):
+    """Return the HTTP status carried by a provider SDK error, if any."""
+    status = getattr(error, "status_code", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    return status
+
+
+def is_transport_error(error):
+    """True for network failures and timeouts, including SDK errors raised from one."""
+    while error is not None:
+        if isinstance(error, (httpx.TransportError, TimeoutError)):
+            return True
+        error = error.__cause__
+    return False
+
+
+def should_fail_over(error):
+    """Rate limits, server errors and transport failures move the call to the next provider.
+
+    Anything else (bad requests, auth, bugs in our own code) is raised as is.
+    """
+    status = error_status(error)
+    if status is not None:
+        return status in FAILOVER_STATUSES
+    return is_transport_error(error)
+
+
+class ProviderStats:
+    """Rolling latency and error window for one provider."""
+
+    def __init__(self, window):
+        self.latencies = deque(maxlen=window)
+        self.outcomes = deque(maxlen=window)
+        self.cooldown_until = 0.0
+        self.lock = threading.Lock()
+
+    def record(self, seconds=None, ok=True):
+        with self.lock:
+            if seconds is not None:
+                self.latencies.append(seconds)
+            self.outcomes.append(ok)
+
+    @property
+    def latency(self):
+        """Median latency over the window; unmeasured providers sort first so they get explored."""
+        with self.lock:
+            ordered = sorted(self.latencies)
+        return ordered[len(ordered) // 2] if ordered else 0.0
+
+    @property
+    def error_rate(self):
+        with self.lock:
+            return self.outcomes.count(False) / len(self.outcomes) if self.outcomes else 0.0
+
+
+class LLMRouter(Runnable):
+    """Routes each call to the fastest healthy provider, hedging slow calls and failing over on errors.
+
+    `providers` maps a provider name to a runnable (a chat model or a structured-output
+    chain). Routers derived with `with_structured_output` share the same health stats.
+    """
+
+    def __init__(
+        self,
+        providers,
+        hedge_after=None,
+        window=50,
+        error_threshold=0.5,
+        cooldown=30.0,
+        stats=None,
+        max_losers=8,
+        pool=None,
+    ):
+        self.providers = dict(providers)
+        self.hedge_after = hedge_after
+        self.error_threshold = error_threshold
+        self.cooldown = cooldown
+        self.stats = stats or {name: ProviderStats(window) for name in self.providers}
+        self.pool = pool or HedgePool(max_losers=max_losers, name="llm-router")
+
+    def with_structured_output(self, schema, **kwargs):
+        return LLMRouter(
+            {name: model.with_structured_output(schema, **kwargs) for name, model in self.providers.items()},
+            hedge_after=self.hedge_after,
+            error_threshold=self.error_threshold,
+            cooldown=self.cooldown,
+            stats=self.stats,
+            pool=self.pool,
+        )
+
+    def ranked(self):
+        """Provider names, healthy ones first, each group ordered by rolling latency."""
+        now = time.monotonic()
+
+        def rank(name):
+            stats = self.stats[name]
+            unhealthy = stats.cooldown_until > now or stats.error_rate > self.error_threshold
+            return unhealthy, stats.latency
+
+        return sorted(self.providers, key=rank)
+
+    def _record(self, name, start, error=None):
+        seconds = time.monotonic() - start
+        stats = self.stats[name]
+        if error is None:
+            stats.record(seconds, ok=True)
+            metrics.observe("llm_request_seconds", seconds, provider=name)
+            return
+
+        stats.record(ok=False)
+        metrics.increment("llm_request_errors", provider=name, status=error_status(error) or "transport")
+        if error_status(error) == 429 or stats.error_rate > self.error_threshold:
+            stats.cooldown_until = time.monotonic() + self.cooldown
+
+    def _call(self, name, input, config, **kwargs):
+        start = time.monotonic()
+        try:
+            result = self.providers[name].invoke(input, config, **kwargs)
+        except Exception as e:
+            self._record(name, start, e)
+            raise
+        self._record(name, start)
+        return result
+
+    async def _acall(self, name, input, config, **kwargs):
+        start = time.monotonic()
+        try:
+            result = await self.providers[name].ainvoke(input, config, **kwargs)
+        except Exception as e:
+            self._record(name, start, e)
+            raise
+        self._record(name, start)
+        return result
+
+    def _hedged(self, primary, backup, input, config, **kwargs):
+        """Run `primary`, starting `backup` too if it is still running after `hedge_after` seconds."""
+        outcome = race(
+            lambda: self._call(primary, input, config, **kwargs),
+            lambda: self._call(backup, input, config, **kwargs),
+            self.hedge_after,
+            accept=_accept_any,
+            retry=should_fail_over,
+            pool=self.pool,
+        )
+        if outcome.hedged:
+            metrics.increment("llm_hedges", provider=backup)
+        return outcome.result
+
+    async def _ahedged(self, primary, backup, input, config, **kwargs):
+        """Async variant of `_hedged`; the losing request is cancelled."""
+        outcome = await arace(
+            lambda: self._acall(primary, input, config, **kwargs),
+            lambda: self._acall(backup, input, config, **kwargs),
+            self.hedge_after,
+            accept=_accept_any,
+            retry=should_fail_over,
+        )
+        if outcome.hedged:
+            metrics.increment("llm_hedges", provider=backup)
+        return outcome.result
+
+    def invoke(self, input, config=None, **kwargs):
+        order = self.ranked()
+        error = None
+        i = 0
+        while i < len(order):
+            hedge = bool(self.hedge_after) and i + 1 < len(order)
+            try:
+                if hedge:
+                    return self._hedged(order[i], order[i + 1], input, config, **kwargs)
+                return self._call(order[i], input, config, **kwargs)
+            except Exception as e:
+                if not should_fail_over(e):
+                    raise
+                error = e
+                metrics.increment("llm_failovers", provider=order[i])
+            i += 2 if hedge else 1
+        raise error
+
+    async def ainvoke(self, input, config=None, **kwargs):
+        order = self.ranked()
+        error = None
+        i = 0
+        while i < len(order):
+            hedge = bool(self.hedge_after) and i + 1 < len(order)
+            try:
+                if hedge:
+                    return await self._ahedged(order[i], order[i + 1], input, config, **kwargs)
+                return await self._acall(order[i], input, config, **kwargs)
+            except Exception as e:
+                if not should_fail_over(e):
+                    raise
+                error = e
+                metrics.increment("llm_failovers", provider=order[i])
+            i += 2 if hedge else 1
+        raise error
@@ -0,0 +1,94 @@
+import re
+from langgraph.types import Send
+from src.config.constants import Constants
+from src.state.agent_state import LifeCycleState, RequirementSection
+from src.state.user_stories import UserStories
+from src.nodes.user_requirement import get_user_requirement, aget_user_requirement
+
+SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+
+def _paragraphs(text):
+    """Split text on blank lines and markdown headings."""
+    paragraphs, current = [], []
+    for line in text.splitlines():
+        if not line.strip() or line.lstrip().startswith("#"):
+            if current:
+                paragraphs.append("\n".join(current))
+            current = [line] if line.strip() else []
+        else:
+            current.append(line)
+    if current:
+        paragraphs.append("\n".join(current))
+    return paragraphs
+
+
+def split_requirement(text, max_chars):
+    """Pack the paragraphs of a requirement into sections of at most `max_chars` characters."""
+    pieces = []
+    for paragraph in _paragraphs(text):
+        if len(paragraph) <= max_chars:
+            pieces.append(paragraph)
+        else:
+            pieces.extend(SENTENCE_END.split(paragraph))
+
+    sections, current = [], ""
+    for piece in pieces:
+        if current and len(current) + len(piece) + 2 > max_chars:
+            sections.append(current)
+            current = piece
+        else:
+            current = f"{current}\n\n{piece}" if current else piece
+    if current:
+        sections.append(current)
+    return sections
+
+
+def _story_key(story):
+    return " ".join(re.findall(r"[a-z0-9]+", story.title.lower()))
+
+
+def merge_stories(user_stories_list):
+    """Merge `UserStories` in order, folding stories with the same title into the first one."""
+    merged = {}
+    for user_stories in user_stories_list:
+        for story in user_stories.stories:
+            key = _story_key(story)
+            if key not in merged:
+                merged[key] = story.model_copy(deep=True)
+                continue
+
+            criteria = merged[key].acceptance_criteria
+            criteria.extend(c for c in story.acceptance_criteria if c not in criteria)
+    return UserStories(stories=list(merged.values()))
+
+
+def route_requirement(state: LifeCycleState):
+    """Fan large requirements out into one structured call per section."""
+    sections = split_requirement(state["prompt"], Constants.REQUIREMENT_SECTION_MAX_CHARS)
+    if len(sections) <= 1:
+        return "user_requirement"
+
+    print(f"Splitting requirement into {len(sections)} sections.")
+    return [
+        Send("user_story_section", {"prompt": section, "section_index": index})
+        for index, section in enumerate(sections)
+    ]
+
+
+def get_section_user_stories(state: RequirementSection):
+    """Generates user stories for one section of a large requirement."""
+    result = get_user_requirement(state)
+    return {"section_stories": [{"index": state["section_index"], "user_stories": result["user_stories"]}]}
+
+
+async def aget_section_user_stories(state: RequirementSection):
+    """Async variant of `get_section_user_stories`."""
+    result = await aget_user_requirement(state)
+    return {"section_stories": [{"index": state["section_index"], "user_stories": result["user_stories"]}]}
+
+
+def merge_section_stories(state: LifeCycleState):
+    """Merges per-section stories, in document order, into one deduplicated `UserStories`."""
+    sections = sorted(state["section_stories"], key=lambda section: section["index"])
+    return {"user_stories": merge_stories(section["user_stories"] for section in sections)}
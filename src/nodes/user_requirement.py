@@ -1,19 +1,70 @@
-from dotenv import load_dotenv
-from langchain_groq import ChatGroq
-from src.state.user_stories import UserStories
+from src.cache.story_cache import get_story_cache
+from src.cache.semantic_cache import get_semantic_cache
+from src.config.constants import Constants
+from src.llms.providers import get_user_story_evaluator
 from src.state.agent_state import LifeCycleState
 
-load_dotenv()
 
-model = ChatGroq(model="llama3-70b-8192", temperature=0)
+def build_user_story_prompt(requirement):
+    """Build the instruction sent to the model for a requirement."""
+    return (
+        f"Split the following requirements into distinct user stories. "
+        f"Each user story should include a title, description, and acceptance criteria: {requirement}"
+    )
+
+
+def build_revision_prompt(requirement, seed):
+    """Build an instruction that revises stories generated for a similar requirement."""
+    return (
+        f"The following user stories were written for a similar requirement:\n{seed.model_dump_json()}\n\n"
+        f"Revise them so they cover exactly the requirements below, keeping the stories that still apply. "
+        f"Each user story should include a title, description, and acceptance criteria: {requirement}"
+    )
+
+
+def _lookup_user_stories(requirement):
+    """Return the prompt to send and any cached `UserStories` for `requirement`."""
+    prompt = build_user_story_prompt(requirement)
+    cache = get_story_cache()
+    result = cache.get(prompt) if cache else None
+    if result is not None:
+        return prompt, result
+
+    semantic_cache = get_semantic_cache()
+    match = semantic_cache.lookup(requirement) if semantic_cache else None
+    if match is None:
+        return prompt, None
+
+    similarity, seed = match
+    print(f"Found a similar requirement (similarity {similarity:.2f}).")
+    if Constants.SEMANTIC_CACHE_MODE == "seed":
+        return build_revision_prompt(requirement, seed), None
+    return prompt, seed
+
+
+def _store_user_stories(requirement, result):
+    """Record freshly generated stories in the exact and semantic caches."""
+    cache = get_story_cache()
+    if cache:
+        cache.set(build_user_story_prompt(requirement), result)
+    semantic_cache = get_semantic_cache()
+    if semantic_cache:
+        semantic_cache.add(requirement, result)
 
-# UserStory schema for structured output
-user_story_evaluator = model.with_structured_output(UserStories)
 
 def get_user_requirement(state: LifeCycleState):
     """Generates structured user stories from user requirements using the `UserStories` schema."""
-    result = user_story_evaluator.invoke(
-        f"Split the following requirements into distinct user stories. "
-        f"Each user story should include a title, description, and acceptance criteria: {state['prompt']}"
-    )
+    prompt, result = _lookup_user_stories(state["prompt"])
+    if result is None:
+        result = get_user_story_evaluator().invoke(prompt)
+        _store_user_stories(state["prompt"], result)
+    return {"user_stories": result}
+
+
+async def aget_user_requirement(state: LifeCycleState):
+    """Async variant of `get_user_requirement` driven by `ainvoke`."""
+    prompt, result = _lookup_user_stories(state["prompt"])
+    if result is None:
+        result = await get_user_story_evaluator().ainvoke(prompt)
+        _store_user_stories(state["prompt"], result)
     return {"user_stories": result}
@@ -1,17 +1,114 @@
+import asyncio
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from src.config.constants import Constants
 from src.state.agent_state import LifeCycleState
-from src.tools.create_user_story import create_user_story
+from src.tools.create_user_story import create_user_story, acreate_user_story
+from src.tools.bulk_create_user_stories import create_user_stories_bulk
 
-def create_user_stories(state: LifeCycleState):
-    if not state["user_stories"].stories:
-        print("No user stories found.")
-        return
 
-    for story in state["user_stories"].stories:
-        print(f"Title: {story.title}")
-        create_user_story(
+def submit_user_story(story):
+    """Create one story in Jira, capturing the outcome instead of raising."""
+    print(f"Title: {story.title}")
+    try:
+        issue = create_user_story(
             title=story.title,
             description=story.description,
             acceptance_criteria=story.acceptance_criteria,
         )
-        
-    return state
\ No newline at end of file
+        return {"title": story.title, "key": issue["key"], "error": None}
+    except Exception as e:
+        print(f"Jira issue creation failed: {e}")
+        return {"title": story.title, "key": None, "error": str(e)}
+
+
+async def asubmit_user_story(story, semaphore):
+    """Async variant of `submit_user_story`, throttled by `semaphore`."""
+    async with semaphore:
+        print(f"Title: {story.title}")
+        try:
+            issue = await acreate_user_story(
+                title=story.title,
+                description=story.description,
+                acceptance_criteria=story.acceptance_criteria,
+            )
+            return {"title": story.title, "key": issue["key"], "error": None}
+        except Exception as e:
+            print(f"Jira issue creation failed: {e}")
+            return {"title": story.title, "key": None, "error": str(e)}
+
+
+def _pending_stories(state):
+    """Return `(index, story)` for stories without a successful result from an earlier attempt."""
+    previous = state.get("jira_results") or []
+    done = {
+        i for i, result in enumerate(previous)
+        if result["error"] is None and i < len(state["user_stories"].stories)
+        and result["title"] == state["user_stories"].stories[i].title
+    }
+    if done:
+        print(f"Skipping {len(done)} user story(ies) created by an earlier attempt.")
+    return [(i, story) for i, story in enumerate(state["user_stories"].stories) if i not in done]
+
+
+def _merge_results(state, pending, results):
+    """Overlay the results for `pending` onto the earlier results, keeping story order."""
+    merged = list(state.get("jira_results") or [])[:len(state["user_stories"].stories)]
+    merged += [None] * (len(state["user_stories"].stories) - len(merged))
+    for (i, _), result in zip(pending, results):
+        merged[i] = result
+    return merged
+
+
+def create_user_stories(state: LifeCycleState):
+    """Creates a Jira issue per user story, in bulk or with a bounded pool of workers.
+
+    `jira_results` is written once, when every story is done, so a checkpoint never holds
+    per-story progress; if the run dies midway, the Jira ledger is what keeps a resume from
+    creating the same issues twice.
+    """
+    if not state["user_stories"].stories:
+        print("No user stories found.")
+        return
+
+    pending = _pending_stories(state)
+    stories = [story for _, story in pending]
+    if not stories:
+        return {"jira_results": state["jira_results"]}
+    if Constants.JIRA_BULK_CREATE:
+        return {"jira_results": _merge_results(state, pending, create_user_stories_bulk(stories))}
+
+    max_workers = max(1, min(Constants.JIRA_MAX_WORKERS, len(stories)))
+
+    # Results are collected in submission order, so they line up with `stories`;
+    # each worker runs in a copy of this context so Jira calls are attributed to the node
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(contextvars.copy_context().run, submit_user_story, story)
+            for story in stories
+        ]
+        results = [future.result() for future in futures]
+
+    return {"jira_results": _merge_results(state, pending, results)}
+
+
+async def acreate_user_stories(state: LifeCycleState):
+    """Async variant of `create_user_stories` that awaits Jira instead of using threads."""
+    if not state["user_stories"].stories:
+        print("No user stories found.")
+        return
+
+    pending = _pending_stories(state)
+    stories = [story for _, story in pending]
+    if not stories:
+        return {"jira_results": state["jira_results"]}
+    if Constants.JIRA_BULK_CREATE:
+        results = await asyncio.to_thread(create_user_stories_bulk, stories)
+        return {"jira_results": _merge_results(state, pending, results)}
+
+    semaphore = asyncio.Semaphore(max(1, Constants.JIRA_MAX_WORKERS))
+
+    # `gather` returns results in the order the coroutines were passed
+    results = await asyncio.gather(*(asubmit_user_story(story, semaphore) for story in stories))
+
+    return {"jira_results": _merge_results(state, pending, results)}
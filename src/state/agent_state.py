@@ -1,7 +1,33 @@
+from typing import Annotated, List, Optional
 from typing_extensions import TypedDict
 from src.state.user_stories import UserStories
 
 
+class JiraResult(TypedDict):
+    title: str
+    key: Optional[str]
+    error: Optional[str]
+
+
+class SectionStories(TypedDict):
+    index: int
+    user_stories: UserStories
+
+
+class RequirementSection(TypedDict):
+    prompt: str
+    section_index: int
+
+
+def add_sections(existing, new):
+    """Append section results; writing None clears them, e.g. when a checkpointed thread starts a new run."""
+    if new is None:
+        return []
+    return (existing or []) + new
+
+
 class LifeCycleState(TypedDict):
     prompt: str
     user_stories: UserStories
+    section_stories: Annotated[List[SectionStories], add_sections]
+    jira_results: List[JiraResult]
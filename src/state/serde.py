@@ -0,0 +1,58 @@
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+from src.state.story_table import StoryTable
+from src.state.user_stories import UserStories
+
+STORIES_TYPE = "msgpack+stories"
+_TABLE_KEY = "__story_table__"
+
+
+def _pack(value):
+    """Return `value` with every `UserStories` swapped for its packed story table, and whether any was."""
+    if isinstance(value, UserStories):
+        return {_TABLE_KEY: StoryTable.from_user_stories(value).to_msgpack()}, True
+    if isinstance(value, dict):
+        packed = {key: _pack(item) for key, item in value.items()}
+        if any(found for _, found in packed.values()):
+            return {key: item for key, (item, _) in packed.items()}, True
+    elif isinstance(value, list):
+        packed = [_pack(item) for item in value]
+        if any(found for _, found in packed):
+            return [item for item, _ in packed], True
+    return value, False
+
+
+def _unpack(value):
+    if isinstance(value, dict):
+        if _TABLE_KEY in value and len(value) == 1:
+            return StoryTable.from_msgpack(value[_TABLE_KEY]).to_user_stories()
+        return {key: _unpack(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_unpack(item) for item in value]
+    return value
+
+
+class StorySerializer(JsonPlusSerializer):
+    """Checkpoint serializer that can store user stories as compact column tables.
+
+    Tables are smaller but slower to load than plain msgpack, so they are only written
+    with `compact=True`. Tables are always readable, whichever way this is set; other
+    values, and checkpoints written by the plain serializer, go through `JsonPlusSerializer`.
+    """
+
+    def __init__(self, *args, compact=False, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.compact = compact
+
+    def dumps_typed(self, obj):
+        if not self.compact:
+            return super().dumps_typed(obj)
+        packed, found = _pack(obj)
+        if not found:
+            return super().dumps_typed(obj)
+        return STORIES_TYPE, super().dumps_typed(packed)[1]
+
+    def loads_typed(self, data):
+        type_, payload = data
+        if type_ != STORIES_TYPE:
+            return super().loads_typed(data)
+        return _unpack(super().loads_typed(("msgpack", payload)))
@@ -0,0 +1,72 @@
+from array import array
+from collections import namedtuple
+import orjson
+import ormsgpack
+from src.state.user_stories import UserStory, UserStories
+
+StoryRow = namedtuple("StoryRow", ["title", "description", "acceptance_criteria"])
+
+
+class StoryTable:
+    """Column-oriented, read-only store for many user stories.
+
+    Criteria of all stories share one flat list; `offsets[i]:offsets[i + 1]` are the
+    criteria of story `i`. Converting to and from `UserStories` skips pydantic validation,
+    so only use it for stories that were validated when first generated.
+    """
+
+    __slots__ = ("titles", "descriptions", "criteria", "offsets")
+
+    def __init__(self, titles, descriptions, criteria, offsets):
+        self.titles = titles
+        self.descriptions = descriptions
+        self.criteria = criteria
+        self.offsets = offsets
+
+    @classmethod
+    def from_user_stories(cls, user_stories):
+        titles, descriptions, criteria, offsets = [], [], [], array("I", [0])
+        for story in user_stories.stories:
+            titles.append(story.title)
+            descriptions.append(story.description)
+            criteria.extend(story.acceptance_criteria)
+            offsets.append(len(criteria))
+        return cls(titles, descriptions, criteria, offsets)
+
+    def __len__(self):
+        return len(self.titles)
+
+    def __getitem__(self, i):
+        return StoryRow(self.titles[i], self.descriptions[i], self.criteria[self.offsets[i]:self.offsets[i + 1]])
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+    def to_user_stories(self):
+        """Rebuild the pydantic models without re-validating them."""
+        construct, criteria, offsets = UserStory.model_construct, self.criteria, self.offsets
+        return UserStories.model_construct(stories=[
+            construct(title=title, description=description, acceptance_criteria=criteria[start:end])
+            for title, description, start, end in zip(self.titles, self.descriptions, offsets, offsets[1:])
+        ])
+
+    def to_msgpack(self):
+        return ormsgpack.packb([self.titles, self.descriptions, self.criteria, self.offsets.tobytes()])
+
+    @classmethod
+    def from_msgpack(cls, data):
+        titles, descriptions, criteria, offsets = ormsgpack.unpackb(data)
+        return cls(titles, descriptions, criteria, array("I", offsets))
+
+    def to_json(self):
+        return orjson.dumps({
+            "titles": self.titles,
+            "descriptions": self.descriptions,
+            "criteria": self.criteria,
+            "offsets": self.offsets.tolist(),
+        })
+
+    @classmethod
+    def from_json(cls, data):
+        columns = orjson.loads(data)
+        return cls(columns["titles"], columns["descriptions"], columns["criteria"], array("I", columns["offsets"]))
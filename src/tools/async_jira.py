@@ -0,0 +1,29 @@
+import os
+import httpx
+from src.utils.http_pool import get_async_httpx_client, arequest
+
+
+class AsyncJira:
+    """Minimal non-blocking Jira REST client covering the calls the workflow makes."""
+
+    def __init__(self, url=None, username=None, password=None, timeout=75):
+        self.url = (url or os.getenv("JIRA_INSTANCE_URL") or "").rstrip("/")
+        username = username or os.getenv("JIRA_USERNAME")
+        password = password or os.getenv("JIRA_API_TOKEN")
+        self.auth = httpx.BasicAuth(username, password) if username else None
+        self.timeout = timeout
+
+    async def issue_create(self, fields):
+        """Create one issue and return Jira's JSON response."""
+        # Requests share the running loop's keep-alive pool instead of opening their own
+        response = await arequest(
+            get_async_httpx_client(),
+            "POST",
+            f"{self.url}/rest/api/2/issue",
+            json={"fields": fields},
+            auth=self.auth,
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+        return response.json()
+
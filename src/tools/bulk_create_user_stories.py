@@ -0,0 +1,125 @@
+import time
+from src.config.constants import Constants
+from src.tools.create_user_story import (
+    build_user_story_fields,
+    find_created_issue,
+    record_created_issue,
+)
+from src.tools.jira_client import get_jira
+from src.tools.jira_ledger import story_hash
+from src.utils.rate_limiter import throttle_jira
+from src.utils.telemetry import track_jira_call
+
+# Jira rejects bulk requests with more than 50 issue updates
+JIRA_BULK_LIMIT = 50
+
+
+def _post_bulk(jira_client, fields_list):
+    """POST one bulk-create request and return `(issues, errors)` as Jira reported them."""
+    throttle_jira(Constants.JIRA_PROJECT_KEY)
+    with track_jira_call("issue_create_bulk"):
+        response = jira_client.post(
+            jira_client.resource_url("issue/bulk"),
+            data={"issueUpdates": [{"fields": fields} for fields in fields_list]},
+            advanced_mode=True,
+        )
+
+    # Partial failures come back as 400 with the created issues still listed
+    if response.status_code >= 500 or response.status_code == 429:
+        response.raise_for_status()
+    body = response.json() if response.content else {}
+    if response.status_code >= 400 and not body.get("issues") and not body.get("errors"):
+        response.raise_for_status()
+
+    errors = {}
+    for error in body.get("errors", []):
+        element_errors = error.get("elementErrors", {})
+        message = "; ".join(
+            element_errors.get("errorMessages", [])
+            + [f"{k}: {v}" for k, v in element_errors.get("errors", {}).items()]
+        )
+        errors[error["failedElementNumber"]] = message or f"HTTP {error.get('status')}"
+    return body.get("issues", []), errors
+
+
+def _create_batch(jira_client, stories, results, indexes):
+    """Send one bulk request for `indexes` and fill `results`; return the indexes that failed."""
+    fields_list = [
+        build_user_story_fields(
+            stories[i].title, stories[i].description, stories[i].acceptance_criteria
+        )
+        for i in indexes
+    ]
+
+    try:
+        issues, errors = _post_bulk(jira_client, fields_list)
+    except Exception as e:
+        for i in indexes:
+            results[i]["error"] = str(e)
+        return list(indexes)
+
+    # Jira lists created issues in request order, skipping the failed elements
+    created = iter(issues)
+    failed = []
+    for position, i in enumerate(indexes):
+        if position in errors:
+            results[i]["error"] = errors[position]
+            failed.append(i)
+            continue
+        issue = next(created, None)
+        if issue is None:
+            # The issue may exist without being reported, so it is not retried
+            results[i]["error"] = "Jira returned fewer issues than requested."
+            continue
+        results[i]["key"] = issue["key"]
+        results[i]["error"] = None
+        content_hash = story_hash(
+            Constants.JIRA_PROJECT_KEY, stories[i].title, stories[i].description, stories[i].acceptance_criteria
+        )
+        record_created_issue(content_hash, stories[i].title, results[i]["key"])
+    return failed
+
+
+def create_user_stories_bulk(stories, jira_client=None, batch_size=JIRA_BULK_LIMIT, max_retries=2, backoff=1.0):
+    """Create `stories` through Jira's bulk endpoint, retrying only the entries that failed.
+
+    Returns one result per story, in input order, shaped like `state["jira_results"]`.
+    """
+    jira_client = jira_client or get_jira()
+    batch_size = max(1, min(batch_size, JIRA_BULK_LIMIT))
+    results = [{"title": story.title, "key": None, "error": None} for story in stories]
+
+    if Constants.JIRA_DRY_RUN:
+        for story in stories:
+            print("user_story: ", build_user_story_fields(story.title, story.description, story.acceptance_criteria))
+        print("=====================================================\n")
+        return results
+
+    # Stories the ledger already knows about are answered locally
+    pending = []
+    for i, story in enumerate(stories):
+        _, issue_key = find_created_issue(story.title, story.description, story.acceptance_criteria)
+        if issue_key:
+            results[i]["key"] = issue_key
+        else:
+            pending.append(i)
+
+    for attempt in range(max_retries + 1):
+        if attempt:
+            time.sleep(backoff * 2 ** (attempt - 1))
+            print(f"Retrying {len(pending)} failed Jira issue(s), attempt {attempt}.")
+
+        failed = []
+        for start in range(0, len(pending), batch_size):
+            failed += _create_batch(jira_client, stories, results, pending[start:start + batch_size])
+
+        pending = failed
+        if not pending:
+            break
+
+    for result in results:
+        if result["key"]:
+            print(f"Jira issue created successfully! Issue Key: {result['key']}")
+        else:
+            print(f"Jira issue creation failed: {result['error']}")
+    return results
@@ -1,23 +1,16 @@
-import os
-from dotenv import load_dotenv
-from atlassian import Jira
+from src.config.constants import Constants
+from src.tools.jira_client import get_jira, get_async_jira
+from src.tools.jira_ledger import get_jira_ledger, story_hash
+from src.utils.rate_limiter import throttle_jira, athrottle_jira
+from src.utils.telemetry import track_jira_call
 
-# Load env vars
-load_dotenv()
 
-jira = Jira(
-    url=os.getenv("JIRA_INSTANCE_URL"),
-    username=os.getenv("JIRA_USERNAME"),
-    password=os.getenv("JIRA_API_TOKEN"),
-)
-
-
-def create_user_story(title, description, acceptance_criteria):
+def build_user_story_fields(title, description, acceptance_criteria):
+    """Build the Jira `fields` payload for a single user story."""
     acceptance_criteria_text = "\n- ".join([""] + acceptance_criteria)
 
-    # Create new user story
-    user_story = {
-        "project": {"key": "LI"},
+    return {
+        "project": {"key": Constants.JIRA_PROJECT_KEY},
         "summary": title,
         "description": f"""{description}
         Acceptance Criteria:
@@ -26,11 +19,63 @@ def create_user_story(title, description, acceptance_criteria):
         "priority": {"name": "Medium"},
     }
 
-    # try:
-    #     issue = jira.issue_create(fields=user_story)
-    #     print(f"Jira issue created successfully! Issue Key: {issue['key']}")
-    # except Exception as e:
-    #     print(f"Jira issue creation failed: {e}")
 
-    print("user_story: ", user_story)
-    print("=====================================================\n")
+def find_created_issue(title, description, acceptance_criteria):
+    """Return the ledger hash and any issue key already created for this story."""
+    ledger = get_jira_ledger()
+    if ledger is None:
+        return None, None
+    content_hash = story_hash(Constants.JIRA_PROJECT_KEY, title, description, acceptance_criteria)
+    return content_hash, ledger.get(content_hash)
+
+
+def record_created_issue(content_hash, title, issue_key):
+    """Remember the issue created for `content_hash` so repeats become a lookup."""
+    ledger = get_jira_ledger()
+    if ledger is not None and content_hash is not None:
+        ledger.record(content_hash, Constants.JIRA_PROJECT_KEY, title, issue_key)
+
+
+def create_user_story(title, description, acceptance_criteria):
+    """Create a Jira story and return its fields and issue key (None on a dry run)."""
+    # Create new user story
+    user_story = build_user_story_fields(title, description, acceptance_criteria)
+
+    if Constants.JIRA_DRY_RUN:
+        print("user_story: ", user_story)
+        print("=====================================================\n")
+        return {"fields": user_story, "key": None}
+
+    content_hash, issue_key = find_created_issue(title, description, acceptance_criteria)
+    if issue_key:
+        print(f"Jira issue already exists. Issue Key: {issue_key}")
+        return {"fields": user_story, "key": issue_key}
+
+    throttle_jira(Constants.JIRA_PROJECT_KEY)
+    with track_jira_call("issue_create"):
+        issue = get_jira().issue_create(fields=user_story)
+    record_created_issue(content_hash, title, issue["key"])
+    print(f"Jira issue created successfully! Issue Key: {issue['key']}")
+    return {"fields": user_story, "key": issue["key"]}
+
+
+async def acreate_user_story(title, description, acceptance_criteria):
+    """Async variant of `create_user_story` backed by the non-blocking Jira client."""
+    user_story = build_user_story_fields(title, description, acceptance_criteria)
+
+    if Constants.JIRA_DRY_RUN:
+        print("user_story: ", user_story)
+        print("=====================================================\n")
+        return {"fields": user_story, "key": None}
+
+    content_hash, issue_key = find_created_issue(title, description, acceptance_criteria)
+    if issue_key:
+        print(f"Jira issue already exists. Issue Key: {issue_key}")
+        return {"fields": user_story, "key": issue_key}
+
+    await athrottle_jira(Constants.JIRA_PROJECT_KEY)
+    with track_jira_call("issue_create"):
+        issue = await get_async_jira().issue_create(user_story)
+    record_created_issue(content_hash, title, issue["key"])
+    print(f"Jira issue created successfully! Issue Key: {issue['key']}")
+    return {"fields": user_story, "key": issue["key"]}
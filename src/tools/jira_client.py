@@ -0,0 +1,43 @@
+import os
+import threading
+from src.config.constants import Constants  # noqa: F401 - loads the .env file
+from src.utils.http_pool import get_requests_session
+
+_lock = threading.Lock()
+_jira = None
+_async_jira = None
+
+
+def get_jira():
+    """Return the process-wide `atlassian.Jira` client, creating it on first use."""
+    global _jira
+    with _lock:
+        if _jira is None:
+            from atlassian import Jira
+
+            _jira = Jira(
+                url=os.getenv("JIRA_INSTANCE_URL"),
+                username=os.getenv("JIRA_USERNAME"),
+                password=os.getenv("JIRA_API_TOKEN"),
+                session=get_requests_session(),
+            )
+        return _jira
+
+
+def get_async_jira():
+    """Return the process-wide `AsyncJira` client, creating it on first use."""
+    global _async_jira
+    with _lock:
+        if _async_jira is None:
+            from src.tools.async_jira import AsyncJira
+
+            _async_jira = AsyncJira()
+        return _async_jira
+
+
+def set_jira(jira=None, async_jira=None):
+    """Replace the Jira clients, e.g. with fakes or a local stub; None resets to the default."""
+    global _jira, _async_jira
+    with _lock:
+        _jira = jira
+        _async_jira = async_jira
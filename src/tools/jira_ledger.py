@@ -0,0 +1,103 @@
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from src.config.constants import Constants
+
+
+def story_hash(project_key, title, description, acceptance_criteria):
+    """Hash the content that makes a story unique within a Jira project."""
+    content = json.dumps([project_key, title, description, list(acceptance_criteria)])
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+class JiraLedger:
+    """SQLite record of the Jira issue created for each story's content hash."""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS issues ("
+            "hash TEXT PRIMARY KEY, project_key TEXT NOT NULL, summary TEXT NOT NULL, "
+            "issue_key TEXT NOT NULL, created_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, content_hash):
+        """Return the issue key recorded for `content_hash`, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT issue_key FROM issues WHERE hash = ?", (content_hash,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def record(self, content_hash, project_key, summary, issue_key):
+        """Remember that `issue_key` was created for `content_hash`."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO issues (hash, project_key, summary, issue_key, created_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (content_hash, project_key, summary, issue_key, time.time()),
+            )
+            self._conn.commit()
+
+    def forget(self, content_hash):
+        with self._lock:
+            self._conn.execute("DELETE FROM issues WHERE hash = ?", (content_hash,))
+            self._conn.commit()
+
+    def entries(self):
+        """Return every ledger entry as a dict."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT hash, project_key, summary, issue_key FROM issues ORDER BY created_at"
+            ).fetchall()
+        return [
+            {"hash": h, "project_key": p, "summary": s, "issue_key": k}
+            for h, p, s, k in rows
+        ]
+
+    def reconcile(self, jira_client, prune=False):
+        """Diff the ledger against Jira.
+
+        Returns entries whose issue still matches (`ok`), no longer exists
+        (`missing`) or now has a different summary (`mismatched`). With `prune`,
+        missing entries are dropped so the next create recreates them.
+        """
+        report = {"ok": [], "missing": [], "mismatched": []}
+        for entry in self.entries():
+            if not jira_client.issue_exists(entry["issue_key"]):
+                report["missing"].append(entry)
+                if prune:
+                    self.forget(entry["hash"])
+                continue
+
+            issue = jira_client.issue(entry["issue_key"], fields="summary")
+            if issue["fields"]["summary"] != entry["summary"]:
+                report["mismatched"].append(entry)
+            else:
+                report["ok"].append(entry)
+        return report
+
+
+_ledger = None
+_ledger_lock = threading.Lock()
+
+
+def get_jira_ledger():
+    """Return the process-wide ledger, or None when it is disabled."""
+    global _ledger
+    if not Constants.JIRA_LEDGER_ENABLED:
+        return None
+
+    with _ledger_lock:
+        if _ledger is None:
+            _ledger = JiraLedger(Constants.JIRA_LEDGER_PATH)
+        return _ledger
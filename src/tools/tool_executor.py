@@ -0,0 +1,96 @@
+import json
+import threading
+import contextvars
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from langchain_core.messages import ToolMessage
+from langchain_core.tools import BaseTool, StructuredTool
+from src.utils.telemetry import metrics
+
+
+def pure(fn):
+    """Mark a tool whose result depends only on its arguments, so results can be reused."""
+    fn.pure = True
+    return fn
+
+
+class ToolExecutor:
+    """Graph node that runs the tool calls of the last AI message concurrently.
+
+    At most `max_concurrency` calls run at once and results keep the order of the calls.
+    Results of tools marked with `pure` are memoized by argument in an LRU of `cache_size`.
+    Failures are returned to the model as error tool messages, like `ToolNode` does.
+    """
+
+    def __init__(self, tools, max_concurrency=4, cache_size=1024):
+        self.tools = {}
+        self.pure_tools = set()
+        for fn in tools:
+            tool = fn if isinstance(fn, BaseTool) else StructuredTool.from_function(fn)
+            self.tools[tool.name] = tool
+            if getattr(fn, "pure", False):
+                self.pure_tools.add(tool.name)
+        self.max_concurrency = max_concurrency
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self._counts = {"hits": 0, "misses": 0}
+
+    def _cached(self, key):
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                self._counts["hits"] += 1
+                return True, self._cache[key]
+            self._counts["misses"] += 1
+            return False, None
+
+    def _remember(self, key, result):
+        with self._lock:
+            self._cache[key] = result
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def run(self, call):
+        """Run one tool call and return its `ToolMessage`."""
+        name = call["name"]
+        key = None
+        if name in self.pure_tools:
+            key = (name, json.dumps(call["args"], sort_keys=True, default=str))
+            hit, result = self._cached(key)
+            metrics.increment("tool_cache", tool=name, result="hit" if hit else "miss")
+            if hit:
+                return ToolMessage(content=result, name=name, tool_call_id=call["id"])
+
+        try:
+            if name not in self.tools:
+                raise ValueError(f"{name} is not a valid tool, try one of [{', '.join(self.tools)}].")
+            result = str(self.tools[name].invoke(call["args"]))
+        except Exception as e:
+            return ToolMessage(
+                content=f"Error: {e!r}\n Please fix your mistakes.",
+                name=name,
+                tool_call_id=call["id"],
+                status="error",
+            )
+        if key is not None:
+            self._remember(key, result)
+        return ToolMessage(content=result, name=name, tool_call_id=call["id"])
+
+    def __call__(self, state):
+        calls = state["messages"][-1].tool_calls
+        if len(calls) <= 1 or self.max_concurrency <= 1:
+            return {"messages": [self.run(call) for call in calls]}
+
+        # Each call runs in a copy of this context so tracing follows it into the pool
+        with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(calls))) as executor:
+            futures = [executor.submit(contextvars.copy_context().run, self.run, call) for call in calls]
+            return {"messages": [future.result() for future in futures]}
+
+    def stats(self):
+        """Return cache hits, misses, hit rate and size."""
+        with self._lock:
+            counts = dict(self._counts)
+            size = len(self._cache)
+        lookups = counts["hits"] + counts["misses"]
+        return {**counts, "hit_rate": counts["hits"] / lookups if lookups else 0.0, "size": size}
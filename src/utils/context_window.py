@@ -0,0 +1,81 @@
+import json
+from langchain_core.messages import HumanMessage, SystemMessage
+
+
+def count_tokens(messages):
+    """Rough token count (about four characters per token) for a prompt string or message list."""
+    if isinstance(messages, str):
+        return len(messages) // 4
+    if not isinstance(messages, (list, tuple)):
+        return len(str(messages)) // 4
+    chars = 0
+    for message in messages:
+        chars += len(str(getattr(message, "content", message)))
+        for call in getattr(message, "tool_calls", None) or []:
+            chars += len(call["name"]) + len(json.dumps(call["args"], default=str))
+    return chars // 4
+
+
+def split_turns(messages):
+    """Group messages into turns, each starting at a human message.
+
+    Tool calls and their results stay in the turn of the request that caused them,
+    so a window that starts on a turn boundary never orphans a tool result.
+    """
+    turns = []
+    for message in messages:
+        if isinstance(message, HumanMessage) or not turns:
+            turns.append([])
+        turns[-1].append(message)
+    return turns
+
+
+class ContextWindow:
+    """Builds bounded prompts from a growing conversation.
+
+    Between `max_turns` and twice that many recent turns go to the model verbatim. Older
+    turns are folded into a running summary in batches, so each summary call only covers
+    what is new. Further turns are folded while the prompt is over `max_tokens`; the
+    latest turn is always kept.
+    """
+
+    def __init__(self, llm, max_turns=4, max_tokens=3000, summary_words=150):
+        self.llm = llm
+        self.max_turns = max_turns
+        self.max_tokens = max_tokens
+        self.summary_words = summary_words
+
+    def summarize(self, summary, messages):
+        """Return `summary` updated with `messages`."""
+        transcript = "\n".join(f"{message.type}: {message.content}" for message in messages)
+        response = self.llm.invoke(
+            f"Update the summary of this conversation with the new messages, in under "
+            f"{self.summary_words} words. Keep numbers, results and open requests.\n\n"
+            f"Summary so far:\n{summary or '(none)'}\n\nNew messages:\n{transcript}"
+        )
+        return response.content
+
+    def fit(self, system, messages, summary="", summarized=0):
+        """Return `(prompt, summary, summarized)` for `messages`.
+
+        `summarized` is how many leading messages the summary already covers.
+        """
+        turns = split_turns(messages[summarized:])
+        # Fold in batches of `max_turns` so the summary is not rewritten on every call
+        folded = turns[:-self.max_turns] if len(turns) > 2 * self.max_turns else []
+        kept = turns[len(folded):]
+
+        def prompt_for(summary, kept):
+            prompt = [system]
+            if summary:
+                prompt.append(SystemMessage(content=f"Summary of the earlier conversation: {summary}"))
+            return prompt + [message for turn in kept for message in turn]
+
+        while len(kept) > 1 and count_tokens(prompt_for(summary, kept)) > self.max_tokens:
+            folded.append(kept.pop(0))
+
+        if folded:
+            old_messages = [message for turn in folded for message in turn]
+            summary = self.summarize(summary, old_messages)
+            summarized += len(old_messages)
+        return prompt_for(summary, kept), summary, summarized
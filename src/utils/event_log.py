@@ -0,0 +1,61 @@
+import json
+import threading
+from collections import deque
+
+
+def _describe(update):
+    """Plain-data view of one node update, for structured sinks."""
+    if not isinstance(update, dict):
+        return {"value": repr(update)}
+    messages = update.get("messages") or []
+    if not isinstance(messages, list):
+        messages = [messages]
+    return {
+        "messages": [
+            {
+                "type": getattr(message, "type", type(message).__name__),
+                "content": getattr(message, "content", None),
+                "tool_calls": [call["name"] for call in getattr(message, "tool_calls", None) or []],
+            }
+            for message in messages
+        ]
+    }
+
+
+class EventLog:
+    """Keeps the last `maxlen` per-node graph updates, optionally forwarding each to `sink`.
+
+    Updates are stored as-is and only formatted when `text()` is called, so logging stays
+    cheap however long the conversation gets. With `format_events=False` nothing is formatted.
+    """
+
+    def __init__(self, maxlen=200, sink=None, format_events=True):
+        self.events = deque(maxlen=maxlen)
+        self.sink = sink
+        self.format_events = format_events
+        self.count = 0
+
+    def add(self, node, update):
+        self.events.append((node, update))
+        self.count += 1
+        if self.sink is not None:
+            self.sink({"node": node, **_describe(update)})
+
+    def text(self):
+        if not self.format_events:
+            return ""
+        dropped = self.count - len(self.events)
+        lines = [f"... {dropped} earlier events dropped"] if dropped else []
+        lines += [f"{node}: {update!r}" for node, update in self.events]
+        return "\n".join(lines)
+
+
+def jsonl_sink(path):
+    """Return a sink that appends every event to `path` as one JSON line."""
+    lock = threading.Lock()
+
+    def write(event):
+        with lock, open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(event, default=str) + "\n")
+
+    return write
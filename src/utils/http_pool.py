@@ -0,0 +1,157 @@
+import asyncio
+import threading
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from src.config.constants import Constants
+
+# Statuses worth retrying; urllib3 and the Groq SDK both honour Retry-After on these
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+# A gateway 5xx can arrive after Jira already created the issues, so POSTs are only
+# resent on statuses that mean the request was not processed; callers handle the rest
+POST_RETRY_STATUSES = (429, 503)
+
+_lock = threading.Lock()
+_session = None
+_httpx_client = None
+# One async client per event loop; keyed by the loop that opened its connections
+_async_httpx_clients = {}
+
+
+class SafeRetry(Retry):
+    """Retries idempotent requests on `RETRY_STATUSES`, but other methods only on `POST_RETRY_STATUSES`.
+
+    Read errors are only retried for idempotent methods, as urllib3 does by default.
+    """
+
+    def is_retry(self, method, status_code, has_retry_after=False):
+        if not self._is_method_retryable(method):
+            return bool(self.total) and status_code in POST_RETRY_STATUSES
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+def retry_statuses(method):
+    """Statuses that `method` may be resent on."""
+    return RETRY_STATUSES if method.upper() in Retry.DEFAULT_ALLOWED_METHODS else POST_RETRY_STATUSES
+
+
+def get_requests_session():
+    """Return the process-wide `requests.Session` with a sized pool and retry adapter."""
+    global _session
+    with _lock:
+        if _session is None:
+            retry = SafeRetry(
+                total=Constants.HTTP_MAX_RETRIES,
+                backoff_factor=Constants.HTTP_BACKOFF_FACTOR,
+                status_forcelist=RETRY_STATUSES,
+                respect_retry_after_header=True,
+                raise_on_status=False,
+            )
+            adapter = HTTPAdapter(
+                pool_connections=Constants.HTTP_POOL_SIZE,
+                pool_maxsize=Constants.HTTP_POOL_SIZE,
+                max_retries=retry,
+            )
+            _session = requests.Session()
+            _session.mount("https://", adapter)
+            _session.mount("http://", adapter)
+        return _session
+
+
+def _httpx_limits():
+    return httpx.Limits(
+        max_connections=Constants.HTTP_POOL_SIZE,
+        max_keepalive_connections=Constants.HTTP_POOL_SIZE,
+        keepalive_expiry=Constants.HTTP_KEEPALIVE_EXPIRY,
+    )
+
+
+def get_httpx_client():
+    """Return the process-wide keep-alive `httpx.Client` used by the LLM clients."""
+    global _httpx_client
+    with _lock:
+        if _httpx_client is None:
+            _httpx_client = httpx.Client(limits=_httpx_limits())
+        return _httpx_client
+
+
+def get_async_httpx_client():
+    """Return the keep-alive `httpx.AsyncClient` for the running event loop.
+
+    Async connections stay bound to the loop that opened them, so each loop gets its
+    own client; clients of loops that have since closed are dropped.
+    """
+    loop = asyncio.get_running_loop()
+    with _lock:
+        for closed in [other for other in _async_httpx_clients if other.is_closed()]:
+            del _async_httpx_clients[closed]
+        if loop not in _async_httpx_clients:
+            _async_httpx_clients[loop] = httpx.AsyncClient(limits=_httpx_limits())
+        return _async_httpx_clients[loop]
+
+
+def _retry_delay(response, attempt):
+    """Seconds to wait before retrying `response`, preferring the server's Retry-After."""
+    retry_after = response.headers.get("Retry-After")
+    if retry_after and retry_after.replace(".", "", 1).isdigit():
+        return float(retry_after)
+    return Constants.HTTP_BACKOFF_FACTOR * 2 ** attempt
+
+
+async def arequest(client, method, url, **kwargs):
+    """Send a request with `client`, retrying retryable statuses like the sync adapter does."""
+    statuses = retry_statuses(method)
+    for attempt in range(Constants.HTTP_MAX_RETRIES + 1):
+        response = await client.request(method, url, **kwargs)
+        if response.status_code not in statuses or attempt == Constants.HTTP_MAX_RETRIES:
+            return response
+        await asyncio.sleep(_retry_delay(response, attempt))
+
+
+def _requests_pool_stats(session):
+    stats = []
+    for adapter in dict.fromkeys(session.adapters.values()):
+        pools = adapter.poolmanager.pools
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            idle = sum(conn is not None for conn in list(pool.pool.queue))
+            stats.append({
+                "client": "requests",
+                "host": f"{pool.scheme}://{pool.host}:{pool.port}",
+                "max_size": pool.pool.maxsize,
+                "idle": idle,
+                "opened": pool.num_connections,
+                "requests": pool.num_requests,
+            })
+    return stats
+
+
+def _httpx_pool_stats(name, client):
+    # httpx keeps its connection pool on the default transport
+    pool = getattr(getattr(client, "_transport", None), "_pool", None)
+    if pool is None:
+        return []
+    connections = pool.connections
+    return [{
+        "client": name,
+        "host": "*",
+        "max_size": Constants.HTTP_POOL_SIZE,
+        "idle": sum(conn.is_idle() for conn in connections),
+        "opened": len(connections),
+        "requests": None,
+    }]
+
+
+def get_pool_stats():
+    """Return utilization for every pool that has been created so far."""
+    stats = []
+    if _session is not None:
+        stats += _requests_pool_stats(_session)
+    if _httpx_client is not None:
+        stats += _httpx_pool_stats("httpx", _httpx_client)
+    for client in list(_async_httpx_clients.values()):
+        stats += _httpx_pool_stats("httpx-async", client)
+    return stats
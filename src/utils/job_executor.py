@@ -0,0 +1,174 @@
+import time
+import uuid
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from src.config.constants import Constants
+
+
+class JobCancelled(Exception):
+    """Raised inside a job once cancellation has been requested."""
+
+
+class Job:
+    """Handle for one background run: status, progress, partial results and cancellation.
+
+    Cancellation is cooperative; the running function calls `check_cancelled` between
+    steps, so a step already in flight (an LLM call, say) finishes first. A job shared by
+    several subscribers (Streamlit sessions, say) is only cancelled once every one of them
+    has cancelled it; subscribing twice with the same id counts once.
+    """
+
+    def __init__(self, key=None, subscriber=None):
+        self.id = uuid.uuid4().hex
+        self.key = key
+        self.progress = 0.0
+        self.message = ""
+        self.partial = []
+        self.future = None
+        self.finished_at = None
+        self.subscribers = set() if subscriber is None else {subscriber}
+        self._cancel = threading.Event()
+        self._lock = threading.Lock()
+
+    @property
+    def status(self):
+        if self.future.cancelled() or (self.done() and isinstance(self.future.exception(), JobCancelled)):
+            return "cancelled"
+        if self.done():
+            return "failed" if self.future.exception() else "done"
+        return "running" if self.future.running() else "queued"
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    def done(self):
+        return self.future.done()
+
+    def subscribe(self, subscriber):
+        """Add `subscriber` to the callers waiting on this job."""
+        if subscriber is not None:
+            with self._lock:
+                self.subscribers.add(subscriber)
+
+    def cancel(self, subscriber=None):
+        """Drop `subscriber`, cancelling the job when no other is left; return whether it was.
+
+        Without a `subscriber` the job is cancelled for everyone.
+        """
+        with self._lock:
+            if subscriber is not None:
+                self.subscribers.discard(subscriber)
+                if self.subscribers:
+                    return False
+        self._cancel.set()
+        self.future.cancel()
+        return True
+
+    def check_cancelled(self):
+        if self._cancel.is_set():
+            raise JobCancelled(f"Job {self.id} was cancelled.")
+
+    def report(self, progress=None, message=None, item=None):
+        """Update progress (0 to 1), the status message, or append a partial result."""
+        if progress is not None:
+            self.progress = progress
+        if message is not None:
+            self.message = message
+        if item is not None:
+            self.partial.append(item)
+
+    def result(self, timeout=None):
+        return self.future.result(timeout)
+
+    def error(self):
+        return None if self.future.cancelled() else self.future.exception()
+
+
+class JobExecutor:
+    """Process-wide pool running jobs off the caller's thread.
+
+    Submitting with the `key` of a job that is still queued or running returns that job
+    instead of starting another. Finished jobs are kept for `retention` seconds so late
+    polls can still collect their result.
+    """
+
+    def __init__(self, max_workers=4, retention=600):
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="job")
+        self.retention = retention
+        self._jobs = {}
+        self._in_flight = {}
+        self._lock = threading.Lock()
+
+    def submit(self, fn, *args, key=None, subscriber=None, **kwargs):
+        """Run `fn(job, *args, **kwargs)` in the background and return its `Job`.
+
+        `subscriber` identifies the caller, so a shared job is only cancelled once all of
+        its subscribers have cancelled it.
+        """
+        with self._lock:
+            self._prune()
+            if key is not None and key in self._in_flight:
+                job = self._in_flight[key]
+                job.subscribe(subscriber)
+                return job
+
+            job = Job(key, subscriber)
+            job.future = self._pool.submit(fn, job, *args, **kwargs)
+            self._jobs[job.id] = job
+            if key is not None:
+                self._in_flight[key] = job
+        job.future.add_done_callback(lambda _: self._finished(job))
+        return job
+
+    def _finished(self, job):
+        with self._lock:
+            job.finished_at = time.monotonic()
+            if self._in_flight.get(job.key) is job:
+                del self._in_flight[job.key]
+
+    def _prune(self):
+        cutoff = time.monotonic() - self.retention
+        for job_id in [job_id for job_id, job in self._jobs.items() if job.finished_at and job.finished_at < cutoff]:
+            del self._jobs[job_id]
+
+    def get(self, job_id):
+        """Return the job with `job_id`, or None once it has been pruned."""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def stats(self):
+        with self._lock:
+            statuses = [job.status for job in self._jobs.values()]
+        return {status: statuses.count(status) for status in set(statuses)}
+
+
+_lock = threading.Lock()
+_executor = None
+
+
+def get_job_executor():
+    """Return the process-wide job executor, shared by every Streamlit session."""
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = JobExecutor(Constants.JOB_MAX_WORKERS, Constants.JOB_RETENTION_SECONDS)
+        return _executor
+
+
+def run_graph(job, graph, input, config=None, total_steps=None):
+    """Stream `graph` inside `job`, reporting each finished node, and return the final state.
+
+    Progress is the share of `total_steps` done so far when that is given.
+    """
+    steps, values = 0, None
+    for mode, chunk in graph.stream(input, config, stream_mode=["updates", "values"]):
+        job.check_cancelled()
+        if mode == "values":
+            values = chunk
+            continue
+        steps += 1
+        progress = min(steps / total_steps, 0.99) if total_steps else None
+        job.report(progress=progress, message=f"Finished {', '.join(chunk)}")
+    job.report(progress=1.0)
+    return values
@@ -0,0 +1,178 @@
+import os
+import time
+import asyncio
+import sqlite3
+import threading
+from langchain_core.runnables import Runnable
+from src.config.constants import Constants
+from src.utils.context_window import count_tokens
+from src.utils.telemetry import metrics
+
+
+class TokenBucket:
+    """In-process token bucket holding up to `capacity` tokens, refilled at `rate` tokens per second."""
+
+    def __init__(self, name, capacity, rate):
+        self.name = name
+        self.capacity = capacity
+        self.rate = rate
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def try_acquire(self, amount):
+        """Take `amount` tokens if available; otherwise return the seconds until they will be."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= amount:
+                self._tokens -= amount
+                return 0.0
+            return (amount - self._tokens) / self.rate
+
+
+class SQLiteTokenBucket:
+    """Token bucket whose state lives in SQLite so every process on the host shares it."""
+
+    def __init__(self, name, capacity, rate, path):
+        self.name = name
+        self.capacity = capacity
+        self.rate = rate
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS buckets (name TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL)"
+        )
+        self._lock = threading.Lock()
+
+    def try_acquire(self, amount):
+        """Take `amount` tokens if available; otherwise return the seconds until they will be."""
+        with self._lock:
+            # BEGIN IMMEDIATE takes the write lock, so the read-refill-write cycle is atomic across processes
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                now = time.time()
+                row = self._conn.execute(
+                    "SELECT tokens, updated FROM buckets WHERE name = ?", (self.name,)
+                ).fetchone()
+                tokens = self.capacity if row is None else min(self.capacity, row[0] + (now - row[1]) * self.rate)
+                wait = 0.0
+                if tokens >= amount:
+                    tokens -= amount
+                else:
+                    wait = (amount - tokens) / self.rate
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO buckets (name, tokens, updated) VALUES (?, ?, ?)",
+                    (self.name, tokens, now),
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return wait
+
+
+def _amount(bucket, amount):
+    # A request larger than the bucket could never be served; let it through at full capacity
+    return min(amount, bucket.capacity)
+
+
+def acquire(bucket, amount=1):
+    """Block until `amount` tokens are taken from `bucket`."""
+    amount = _amount(bucket, amount)
+    waited = 0.0
+    while (wait := bucket.try_acquire(amount)) > 0:
+        time.sleep(wait)
+        waited += wait
+    if waited:
+        metrics.observe("rate_limit_wait_seconds", waited, bucket=bucket.name)
+
+
+async def aacquire(bucket, amount=1):
+    """Async variant of `acquire` that yields to the event loop while waiting.
+
+    A SQLite bucket may block on another process's lock, so it is asked from a worker thread.
+    """
+    amount = _amount(bucket, amount)
+    waited = 0.0
+
+    async def try_acquire():
+        if isinstance(bucket, SQLiteTokenBucket):
+            return await asyncio.to_thread(bucket.try_acquire, amount)
+        return bucket.try_acquire(amount)
+
+    while (wait := await try_acquire()) > 0:
+        await asyncio.sleep(wait)
+        waited += wait
+    if waited:
+        metrics.observe("rate_limit_wait_seconds", waited, bucket=bucket.name)
+
+
+_buckets = {}
+_buckets_lock = threading.Lock()
+
+
+def get_bucket(name, per_minute):
+    """Return the shared bucket `name` allowing `per_minute` tokens, or None when limiting is off."""
+    if not Constants.RATE_LIMIT_BACKEND or not per_minute:
+        return None
+
+    with _buckets_lock:
+        if name not in _buckets:
+            if Constants.RATE_LIMIT_BACKEND == "sqlite":
+                _buckets[name] = SQLiteTokenBucket(name, per_minute, per_minute / 60, Constants.RATE_LIMIT_DB_PATH)
+            else:
+                _buckets[name] = TokenBucket(name, per_minute, per_minute / 60)
+        return _buckets[name]
+
+
+def estimate_tokens(input):
+    """Rough token count for a prompt plus the expected completion."""
+    return count_tokens(input) + Constants.LLM_COMPLETION_TOKEN_ESTIMATE
+
+
+def _llm_buckets(provider, input):
+    limits = Constants.LLM_RATE_LIMITS.get(provider, {})
+    return [
+        (get_bucket(f"{provider}:requests", limits.get("rpm")), 1),
+        (get_bucket(f"{provider}:tokens", limits.get("tpm")), estimate_tokens(input)),
+    ]
+
+
+def throttle_jira(project_key):
+    """Wait for a Jira request slot for `project_key`."""
+    bucket = get_bucket(f"jira:{project_key}", Constants.JIRA_REQUESTS_PER_MINUTE)
+    if bucket:
+        acquire(bucket)
+
+
+async def athrottle_jira(project_key):
+    bucket = get_bucket(f"jira:{project_key}", Constants.JIRA_REQUESTS_PER_MINUTE)
+    if bucket:
+        await aacquire(bucket)
+
+
+class RateLimitedRunnable(Runnable):
+    """Waits for the provider's request and token buckets before every call to `runnable`."""
+
+    def __init__(self, runnable, provider):
+        self.runnable = runnable
+        self.provider = provider
+
+    def with_structured_output(self, schema, **kwargs):
+        return RateLimitedRunnable(self.runnable.with_structured_output(schema, **kwargs), self.provider)
+
+    def invoke(self, input, config=None, **kwargs):
+        for bucket, amount in _llm_buckets(self.provider, input):
+            if bucket:
+                acquire(bucket, amount)
+        return self.runnable.invoke(input, config, **kwargs)
+
+    async def ainvoke(self, input, config=None, **kwargs):
+        for bucket, amount in _llm_buckets(self.provider, input):
+            if bucket:
+                await aacquire(bucket, amount)
+        return await self.runnable.ainvoke(input, config, **kwargs)
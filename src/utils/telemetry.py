@@ -0,0 +1,243 @@
+import json
+import time
+import logging
+import inspect
+import threading
+import functools
+import contextvars
+from contextlib import contextmanager
+from collections import defaultdict, deque
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from langchain_core.callbacks import get_usage_metadata_callback
+
+logger = logging.getLogger("software_lifecycle.telemetry")
+
+# Samples kept per histogram series when computing percentiles
+MAX_SAMPLES = 10000
+
+
+def _percentile(samples, q):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(q / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def _series(name, labels):
+    return name, tuple(sorted(labels.items()))
+
+
+class Metrics:
+    """In-process counters and histograms with percentile summaries and a Prometheus text export."""
+
+    def __init__(self, max_samples=MAX_SAMPLES):
+        self._lock = threading.Lock()
+        self._counters = defaultdict(float)
+        self._samples = defaultdict(lambda: deque(maxlen=max_samples))
+        self._totals = defaultdict(lambda: [0, 0.0])
+
+    def increment(self, name, value=1, **labels):
+        with self._lock:
+            self._counters[_series(name, labels)] += value
+
+    def observe(self, name, value, **labels):
+        key = _series(name, labels)
+        with self._lock:
+            self._samples[key].append(value)
+            self._totals[key][0] += 1
+            self._totals[key][1] += value
+
+    def summary(self, name, **labels):
+        """Return count, sum and p50/p95/p99 for one histogram series, or None if empty."""
+        key = _series(name, labels)
+        with self._lock:
+            samples = list(self._samples.get(key, ()))
+            count, total = self._totals.get(key, (0, 0.0))
+        if not samples:
+            return None
+        return {
+            "count": count,
+            "sum": total,
+            "p50": _percentile(samples, 50),
+            "p95": _percentile(samples, 95),
+            "p99": _percentile(samples, 99),
+        }
+
+    def summaries(self, name):
+        """Return `{"label=value,...": summary}` for every series of histogram `name`."""
+        with self._lock:
+            keys = [key for key in self._samples if key[0] == name]
+        return {
+            ",".join(f"{k}={v}" for k, v in labels): self.summary(name, **dict(labels))
+            for _, labels in keys
+        }
+
+    def to_prometheus(self):
+        """Render every metric in the Prometheus text exposition format."""
+        def render_labels(labels, extra=()):
+            pairs = [f'{k}="{v}"' for k, v in labels + tuple(extra)]
+            return "{" + ",".join(pairs) + "}" if pairs else ""
+
+        lines = []
+        with self._lock:
+            counters = dict(self._counters)
+            histograms = {key: (list(samples), self._totals[key]) for key, samples in self._samples.items()}
+
+        for (name, labels), value in sorted(counters.items()):
+            lines.append(f"{name}_total{render_labels(labels)} {value}")
+        for (name, labels), (samples, (count, total)) in sorted(histograms.items()):
+            for q in (0.5, 0.95, 0.99):
+                value = _percentile(samples, q * 100)
+                lines.append(f"{name}{render_labels(labels, [('quantile', q)])} {value}")
+            lines.append(f"{name}_count{render_labels(labels)} {count}")
+            lines.append(f"{name}_sum{render_labels(labels)} {total}")
+        return "\n".join(lines) + "\n"
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+            self._samples.clear()
+            self._totals.clear()
+
+
+metrics = Metrics()
+
+
+class NodeStats:
+    """Jira activity attributed to the node currently running."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.jira_calls = 0
+        self.jira_seconds = 0.0
+
+    def add_jira_call(self, seconds):
+        with self._lock:
+            self.jira_calls += 1
+            self.jira_seconds += seconds
+
+
+_node_stats = contextvars.ContextVar("node_stats", default=None)
+
+
+@contextmanager
+def track_jira_call(operation):
+    """Time one Jira API call and attribute it to the current node."""
+    start = time.perf_counter()
+    status = "error"
+    try:
+        yield
+        status = "ok"
+    finally:
+        seconds = time.perf_counter() - start
+        metrics.increment("jira_requests", operation=operation, status=status)
+        metrics.observe("jira_request_seconds", seconds, operation=operation)
+        stats = _node_stats.get()
+        if stats is not None:
+            stats.add_jira_call(seconds)
+
+
+def _count_stories(result):
+    if not isinstance(result, dict):
+        return 0
+    if result.get("jira_results") is not None:
+        return len(result["jira_results"])
+    if result.get("user_stories") is not None:
+        return len(result["user_stories"].stories)
+    return sum(len(section["user_stories"].stories) for section in result.get("section_stories", []))
+
+
+def _record(name, start, usage, stats, result, error):
+    seconds = time.perf_counter() - start
+    prompt_tokens = sum(u.get("input_tokens", 0) for u in usage.values())
+    completion_tokens = sum(u.get("output_tokens", 0) for u in usage.values())
+    stories = _count_stories(result)
+
+    metrics.observe("node_seconds", seconds, node=name)
+    metrics.increment("node_runs", node=name, status="error" if error else "ok")
+    metrics.increment("llm_prompt_tokens", prompt_tokens, node=name)
+    metrics.increment("llm_completion_tokens", completion_tokens, node=name)
+    metrics.increment("stories", stories, node=name)
+
+    logger.info(json.dumps({
+        "event": "node_completed",
+        "node": name,
+        "seconds": round(seconds, 4),
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "jira_calls": stats.jira_calls,
+        "jira_seconds": round(stats.jira_seconds, 4),
+        "stories": stories,
+        "error": repr(error) if error else None,
+    }))
+
+
+def instrument_node(name, node):
+    """Wrap a graph node so every run records its latency, token usage, Jira calls and story count."""
+    if inspect.iscoroutinefunction(node):
+        @functools.wraps(node)
+        async def async_wrapper(state):
+            stats = NodeStats()
+            token = _node_stats.set(stats)
+            start, result, error = time.perf_counter(), None, None
+            try:
+                with get_usage_metadata_callback() as usage:
+                    result = await node(state)
+                return result
+            except Exception as e:
+                error = e
+                raise
+            finally:
+                _node_stats.reset(token)
+                _record(name, start, usage.usage_metadata, stats, result, error)
+
+        return async_wrapper
+
+    @functools.wraps(node)
+    def wrapper(state):
+        stats = NodeStats()
+        token = _node_stats.set(stats)
+        start, result, error = time.perf_counter(), None, None
+        try:
+            with get_usage_metadata_callback() as usage:
+                result = node(state)
+            return result
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            _node_stats.reset(token)
+            _record(name, start, usage.usage_metadata, stats, result, error)
+
+    return wrapper
+
+
+def format_summary():
+    """Render p50/p95/p99 node and Jira latencies as a small text table."""
+    lines = [f"{'series':<40}{'count':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"]
+    for metric in ("node_seconds", "jira_request_seconds"):
+        for label, summary in sorted(metrics.summaries(metric).items()):
+            lines.append(
+                f"{metric + '{' + label + '}':<40}{summary['count']:>8}"
+                f"{summary['p50'] * 1000:>10.1f}{summary['p95'] * 1000:>10.1f}{summary['p99'] * 1000:>10.1f}"
+            )
+    return "\n".join(lines)
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = metrics.to_prometheus().encode()
+        self.send_response(200 if self.path == "/metrics" else 404)
+        self.send_header("Content-Type", "text/plain; version=0.0.4")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def start_metrics_server(port=9464, host="127.0.0.1"):
+    """Serve `/metrics` in Prometheus text format from a background thread."""
+    server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
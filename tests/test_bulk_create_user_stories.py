@@ -0,0 +1,78 @@
+import pytest
+from atlassian import Jira
+from benchmarks.fakes import JiraStub
+from src.config.constants import Constants
+from src.state.user_stories import UserStory
+from src.tools import bulk_create_user_stories as bulk
+from src.tools.bulk_create_user_stories import create_user_stories_bulk
+
+
+def make_stories(count):
+    return [
+        UserStory(title=f"Story {i}", description=f"As a user, I want {i}.", acceptance_criteria=[f"Criterion {i}"])
+        for i in range(count)
+    ]
+
+
+@pytest.fixture(autouse=True)
+def live_jira(monkeypatch):
+    monkeypatch.setattr(Constants, "JIRA_DRY_RUN", False)
+    monkeypatch.setattr(Constants, "JIRA_LEDGER_ENABLED", False)
+    monkeypatch.setattr(Constants, "RATE_LIMIT_BACKEND", "")
+
+
+@pytest.fixture
+def stub_jira():
+    def start(**kwargs):
+        stub = JiraStub(latency=0, **kwargs).start()
+        stubs.append(stub)
+        return stub, Jira(url=stub.url, username="user", password="token")
+
+    stubs = []
+    yield start
+    for stub in stubs:
+        stub.stop()
+
+
+def test_keys_follow_input_order_across_batches(stub_jira):
+    stub, jira = stub_jira()
+
+    results = create_user_stories_bulk(make_stories(5), jira_client=jira, batch_size=2)
+
+    assert [result["key"] for result in results] == ["LI-1", "LI-2", "LI-3", "LI-4", "LI-5"]
+    assert all(result["error"] is None for result in results)
+    assert [stub.issues[result["key"]]["summary"] for result in results] == [f"Story {i}" for i in range(5)]
+    assert stub.bulk_requests == 3
+
+
+def test_only_failed_elements_are_retried(stub_jira):
+    stub, jira = stub_jira(fail_elements={1, 3})
+
+    results = create_user_stories_bulk(make_stories(5), jira_client=jira, backoff=0)
+
+    # The first request creates stories 0, 2 and 4; the retry sends only 1 and 3
+    assert stub.bulk_requests == 2
+    assert [result["key"] for result in results] == ["LI-1", "LI-4", "LI-2", "LI-5", "LI-3"]
+    assert all(stub.issues[result["key"]]["summary"] == result["title"] for result in results)
+    assert len(stub.issues) == 5
+
+
+def test_failures_that_outlast_the_retries_are_reported(stub_jira):
+    stub, jira = stub_jira(fail_elements={0}, fail_attempts=10)
+
+    results = create_user_stories_bulk(make_stories(2), jira_client=jira, max_retries=1, backoff=0)
+
+    assert stub.bulk_requests == 2
+    assert results[0]["key"] is None
+    assert "Rejected by the stub." in results[0]["error"]
+    assert results[1]["key"] == "LI-1"
+
+
+def test_missing_issues_are_errors_not_stop_iteration(monkeypatch):
+    monkeypatch.setattr(bulk, "_post_bulk", lambda jira_client, fields_list: ([{"key": "LI-1"}], {}))
+
+    results = create_user_stories_bulk(make_stories(3), jira_client=object(), max_retries=0)
+
+    assert results[0]["key"] == "LI-1"
+    assert [result["key"] for result in results[1:]] == [None, None]
+    assert all(result["error"] == "Jira returned fewer issues than requested." for result in results[1:])
@@ -0,0 +1,48 @@
+import pytest
+from atlassian import Jira
+from benchmarks.fakes import JiraStub
+from src.tools.jira_ledger import JiraLedger, story_hash
+
+
+@pytest.fixture
+def stub():
+    stub = JiraStub(latency=0).start()
+    yield stub
+    stub.stop()
+
+
+@pytest.fixture
+def jira(stub):
+    return Jira(url=stub.url, username="user", password="token")
+
+
+@pytest.fixture
+def ledger(tmp_path, stub, jira):
+    ledger = JiraLedger(str(tmp_path / "ledger.sqlite"))
+    for title in ("Kept", "Deleted", "Renamed"):
+        issue = jira.issue_create(fields={"project": {"key": "LI"}, "summary": title, "issuetype": {"name": "Story"}})
+        ledger.record(story_hash("LI", title, "", []), "LI", title, issue["key"])
+    return ledger
+
+
+def test_reconcile_reports_ok_missing_and_mismatched(stub, jira, ledger):
+    del stub.issues["LI-2"]
+    stub.issues["LI-3"]["summary"] = "Renamed in Jira"
+
+    report = ledger.reconcile(jira)
+
+    assert [entry["issue_key"] for entry in report["ok"]] == ["LI-1"]
+    assert [entry["issue_key"] for entry in report["missing"]] == ["LI-2"]
+    assert [entry["issue_key"] for entry in report["mismatched"]] == ["LI-3"]
+    # Without prune the ledger is left as it was
+    assert len(ledger.entries()) == 3
+
+
+def test_reconcile_prune_forgets_missing_issues(stub, jira, ledger):
+    del stub.issues["LI-2"]
+
+    report = ledger.reconcile(jira, prune=True)
+
+    assert [entry["issue_key"] for entry in report["missing"]] == ["LI-2"]
+    assert ledger.get(story_hash("LI", "Deleted", "", [])) is None
+    assert [entry["issue_key"] for entry in ledger.entries()] == ["LI-1", "LI-3"]